@@ -134,6 +134,7 @@ from .bindings import *
 try:
     from osgeo import gdal
     gdal.UseExceptions()
+    configure_gdal()
 except ModuleNotFoundError:
     print("GDAL not installed. Some functions may not work.")
 
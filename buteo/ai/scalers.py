@@ -290,13 +290,19 @@ def scaler_to_range(
         "max": arr_max,
     }
 
-    num = np.subtract(arr, arr_min)
     den = np.subtract(arr_max, arr_min)
 
-    result = np.zeros_like(arr, dtype="float32")
-    np.divide(num, den, out=result, where=den != 0)
+    # Scale in a single float32 buffer, instead of through float64 and float32 temporaries.
+    # The minimum is subtracted in float64 and cast on write, as float32 cannot resolve values far from zero.
+    result = np.empty(arr.shape, dtype=np.float32)
 
-    result = np.multiply(result, max_val - min_val) + min_val
+    if den != 0:
+        np.subtract(arr, arr_min, out=result, dtype=np.float64, casting="unsafe")
+        np.multiply(result, (max_val - min_val) / den, out=result, casting="unsafe")
+    else:
+        result.fill(0.0)
+
+    np.add(result, min_val, out=result, casting="unsafe")
 
     return result, stat_dict
 
@@ -363,29 +369,27 @@ def scaler_truncate(
             "target_max": target_max,
         }
 
-    truncated = arr
-    if trunc_min is not None:
-        truncated = np.where(arr > trunc_max, trunc_max, arr)
-
-    if trunc_max is not None:
-        truncated = np.where(truncated < trunc_min, trunc_min, truncated)
-
+    # The extremes of the truncated array are the truncated extremes of the input, so no truncated copy is needed.
     if "arr_min" not in stat_dict:
-        stat_dict["arr_min"] = np.min(truncated)
+        stat_dict["arr_min"] = np.clip(np.min(arr), trunc_min, trunc_max)
     if "arr_max" not in stat_dict:
-        stat_dict["arr_max"] = np.max(truncated)
-
-    truncated = truncated.astype(np.float32, copy=False)
+        stat_dict["arr_max"] = np.clip(np.max(arr), trunc_min, trunc_max)
 
     arr_min = stat_dict["arr_min"]
     arr_max = stat_dict["arr_max"]
 
-    num = np.subtract(truncated, arr_min)
     den = np.subtract(arr_max, arr_min)
 
-    result = np.zeros_like(arr, dtype="float32")
-    np.divide(num, den, out=result, where=den != 0)
+    # Truncate and scale in a single float32 buffer, instead of through a temporary per step.
+    result = np.empty(arr.shape, dtype=np.float32)
+    np.clip(arr, trunc_min, trunc_max, out=result, casting="unsafe")
+
+    if den != 0:
+        np.subtract(result, arr_min, out=result, casting="unsafe")
+        np.multiply(result, (target_max - target_min) / den, out=result, casting="unsafe")
+    else:
+        result.fill(0.0)
 
-    result = np.multiply(result, target_max - target_min) + target_min
+    np.add(result, target_min, out=result, casting="unsafe")
 
     return result, stat_dict
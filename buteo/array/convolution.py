@@ -96,72 +96,99 @@ def _convolve_array_2D(
     weights_total = np.sum(weights)
 
     nodata_value = np.float32(nodata_value)
-    mask_2d = mask[:, :, 0]
 
-    for idx_y in prange(arr.shape[0]):
-        for idx_x in range(arr.shape[1]):
-            if mask_2d[idx_y, idx_x] == 0:
-                result[idx_y, idx_x] = arr[idx_y, idx_x]
-                continue
-
-            hood_values = np.zeros(hood_size, dtype="float32")
-            hood_weights = np.zeros(hood_size, dtype="float32")
-            hood_normalise = False
-            hood_center = 0
-            hood_count = 0
-
-            if nodata and arr[idx_y, idx_x] == nodata_value:
-                result[idx_y, idx_x] = nodata_value
-                continue
-
-            for idx_h in range(0, hood_size):
-                hood_y = idx_y + offsets[idx_h][0]
-                hood_x = idx_x + offsets[idx_h][1]
-
-                if hood_y < 0 or hood_y >= arr.shape[0]:
-                    hood_normalise = True
+    # Split the offsets into columns and locate the center offset once, outside the pixel loop.
+    offsets_y = np.ascontiguousarray(offsets[:, 0])
+    offsets_x = np.ascontiguousarray(offsets[:, 1])
+
+    offsets_center_idx = -1
+    for idx_h in range(hood_size):
+        if offsets_y[idx_h] == 0 and offsets_x[idx_h] == 0:
+            offsets_center_idx = idx_h
+
+    # Convolve in tiles of rows and columns, so the rows a tile reaches into stay cached
+    # while it is processed. The tiles are distributed over the threads.
+    tile_rows = 16
+    tile_cols = 256
+    tiles_y = (arr.shape[0] + tile_rows - 1) // tile_rows
+    tiles_x = (arr.shape[1] + tile_cols - 1) // tile_cols
+
+    for idx_tile in prange(tiles_y * tiles_x):
+        tile_y_start = (idx_tile // tiles_x) * tile_rows
+        tile_x_start = (idx_tile % tiles_x) * tile_cols
+        tile_y_end = min(tile_y_start + tile_rows, arr.shape[0])
+        tile_x_end = min(tile_x_start + tile_cols, arr.shape[1])
+
+        # Scratch buffers are reused for every pixel in the tile.
+        hood_values_buffer = np.zeros(hood_size, dtype="float32")
+        hood_weights_buffer = np.zeros(hood_size, dtype="float32")
+
+        for idx_y in range(tile_y_start, tile_y_end):
+            for idx_x in range(tile_x_start, tile_x_end):
+                if mask is not None and mask[idx_y, idx_x] == 0:
+                    result[idx_y, idx_x] = arr[idx_y, idx_x]
                     continue
 
-                if hood_x < 0 or hood_x >= arr.shape[1]:
-                    hood_normalise = True
-                    continue
+                hood_normalise = False
+                hood_center = 0
+                hood_count = 0
+                hood_weights_sum = 0.0
 
-                if nodata and arr[hood_y, hood_x] == nodata_value:
-                    hood_normalise = True
+                if nodata and arr[idx_y, idx_x] == nodata_value:
+                    result[idx_y, idx_x] = nodata_value
                     continue
 
-                hood_val = arr[hood_y, hood_x]
-                if method == 9 and hood_val == func_value:
-                    hood_values[hood_count] = 0.0
-                    hood_weights[hood_count] = 0.0
-                    hood_normalise = True
-                else:
-                    hood_values[hood_count] = hood_val
-                    hood_weights[hood_count] = weights[idx_h]
-                    hood_count += 1
-
-                if offsets[idx_h][0] == 0 and offsets[idx_h][1] == 0:
-                    hood_center = hood_count - 1
+                for idx_h in range(0, hood_size):
+                    hood_y = idx_y + offsets_y[idx_h]
+                    hood_x = idx_x + offsets_x[idx_h]
+
+                    if hood_y < 0 or hood_y >= arr.shape[0]:
+                        hood_normalise = True
+                        continue
+
+                    if hood_x < 0 or hood_x >= arr.shape[1]:
+                        hood_normalise = True
+                        continue
+
+                    if nodata and arr[hood_y, hood_x] == nodata_value:
+                        hood_normalise = True
+                        continue
+
+                    hood_val = arr[hood_y, hood_x]
+                    if method == 9 and hood_val == func_value:
+                        hood_values_buffer[hood_count] = 0.0
+                        hood_weights_buffer[hood_count] = 0.0
+                        hood_normalise = True
+                    else:
+                        hood_values_buffer[hood_count] = hood_val
+                        hood_weights_buffer[hood_count] = weights[idx_h]
+                        hood_weights_sum += weights[idx_h]
+                        hood_count += 1
+
+                    if idx_h == offsets_center_idx:
+                        hood_center = hood_count - 1
+
+                if hood_count == 0:
+                    result[idx_y, idx_x] = nodata_value
+                    continue
 
-            if hood_count == 0:
-                result[idx_y, idx_x] = nodata_value
-                continue
+                hood_values = hood_values_buffer[:hood_count]
+                hood_weights = hood_weights_buffer[:hood_count]
 
-            hood_values = hood_values[:hood_count]
-            hood_weights = hood_weights[:hood_count]
+                # Rescale the remaining weights to the full kernel total in a single pass.
+                if hood_normalise:
+                    hood_weights_scale = weights_total / hood_weights_sum
+                    for idx_w in range(hood_count):
+                        hood_weights[idx_w] *= hood_weights_scale
 
-            if hood_normalise:
-                hood_weights /= np.sum(hood_weights)
-                hood_weights *= weights_total
-
-            result[idx_y, idx_x] = _hood_to_value(
-                method,
-                hood_values,
-                hood_weights,
-                nodata_value,
-                hood_center,
-                func_value,
-            )
+                result[idx_y, idx_x] = _hood_to_value(
+                    method,
+                    hood_values,
+                    hood_weights,
+                    nodata_value,
+                    hood_center,
+                    func_value,
+                )
 
     return result
 
@@ -195,25 +222,29 @@ def convolve_array_simple(
     """
     result = np.zeros(arr.shape, dtype=np.float32)
 
+    col_max = arr.shape[0] - 1
+    row_max = arr.shape[1] - 1
+
+    # Pixels further than this from the border never reach outside the array.
+    edge = 0
+    for i in range(offsets.shape[0]):
+        edge = max(edge, abs(offsets[i, 0]), abs(offsets[i, 1]))
+
     for col in prange(arr.shape[0]):
+        col_interior = col >= edge and col <= col_max - edge
+
         for row in range(arr.shape[1]):
 
             result_value = 0.0
-            for i in range(offsets.shape[0]):
-                new_col = col + offsets[i, 0]
-                new_row = row + offsets[i, 1]
-
-                if new_col < 0:
-                    new_col = 0
-                elif new_col >= arr.shape[0]:
-                    new_col = arr.shape[0] - 1
+            if col_interior and row >= edge and row <= row_max - edge:
+                for i in range(offsets.shape[0]):
+                    result_value += arr[col + offsets[i, 0], row + offsets[i, 1]] * weights[i]
+            else:
+                for i in range(offsets.shape[0]):
+                    new_col = min(max(col + offsets[i, 0], 0), col_max)
+                    new_row = min(max(row + offsets[i, 1], 0), row_max)
 
-                if new_row < 0:
-                    new_row = 0
-                elif new_row >= arr.shape[1]:
-                    new_row = arr.shape[1] - 1
-
-                result_value += arr[new_col, new_row] * weights[i]
+                    result_value += arr[new_col, new_row] * weights[i]
 
             result[col, row] = result_value
 
@@ -237,24 +268,27 @@ def _convolve_array_channels_HWC(
     center_idx = int(hood_size / 2)
 
     for idx_y in prange(arr.shape[0]):
+        # Scratch buffers are reused for every pixel in the row.
+        hood_values_buffer = np.zeros(hood_size, dtype="float32")
+        hood_weights_buffer = np.zeros(hood_size, dtype="float32")
+
         for idx_x in range(arr.shape[1]):
-            hood_values = np.zeros(hood_size, dtype="float32")
-            hood_weights = np.ones(hood_size, dtype="float32")
             hood_count = 0
 
             for idx_c in range(hood_size):
                 if nodata and arr[idx_y, idx_x, idx_c] == nodata_value:
                     continue
 
-                hood_values[hood_count] = arr[idx_y, idx_x, idx_c]
+                hood_values_buffer[hood_count] = arr[idx_y, idx_x, idx_c]
                 hood_count += 1
 
             if hood_count == 0:
                 result[idx_y, idx_x, 0] = nodata_value
                 continue
 
-            hood_values = hood_values[:hood_count]
-            hood_weights = hood_weights[:hood_count] / hood_weights[:hood_count].sum()
+            hood_values = hood_values_buffer[:hood_count]
+            hood_weights = hood_weights_buffer[:hood_count]
+            hood_weights[:] = 1.0 / hood_count
 
             result[idx_y, idx_x, 0] = _hood_to_value(
                 method,
@@ -279,29 +313,32 @@ def _convolve_array_channels_CHW(
     """Internal function for convoling a 3D array along its channels.
     Input should be float32. Channel-first version.
     """
-    result = np.zeros((1, arr.shape[0], arr.shape[1]), dtype="float32")
+    result = np.zeros((1, arr.shape[1], arr.shape[2]), dtype="float32")
 
     hood_size = arr.shape[0]
     center_idx = int(hood_size / 2)
 
     for idx_y in prange(arr.shape[1]):
+        # Scratch buffers are reused for every pixel in the row.
+        hood_values_buffer = np.zeros(hood_size, dtype="float32")
+        hood_weights_buffer = np.zeros(hood_size, dtype="float32")
+
         for idx_x in range(arr.shape[2]):
             hood_count = 0
-            hood_values = np.zeros(hood_size, dtype="float32")
-            hood_weights = np.ones(hood_size, dtype="float32")
 
             for idx_c in range(hood_size):
                 if nodata and arr[idx_c, idx_y, idx_x] == nodata_value:
                     continue
-                hood_values[hood_count] = arr[idx_c, idx_y, idx_x]
+                hood_values_buffer[hood_count] = arr[idx_c, idx_y, idx_x]
                 hood_count += 1
 
             if hood_count == 0:
                 result[0, idx_y, idx_x] = nodata_value
                 continue
 
-            hood_values = hood_values[:hood_count]
-            hood_weights = hood_weights[:hood_count] / hood_weights[:hood_count].sum()
+            hood_values = hood_values_buffer[:hood_count]
+            hood_weights = hood_weights_buffer[:hood_count]
+            hood_weights[:] = 1.0 / hood_count
 
             result[0, idx_y, idx_x] = _hood_to_value(
                 method,
@@ -497,8 +534,13 @@ def convolve_array(
 
     arr = arr.astype(np.float32, copy=False)
 
-    if mask is None:
-        mask = np.ones(arr.shape, dtype=np.uint8)
+    # The kernel only reads a single spatial mask. Without one, the mask check is compiled away.
+    if mask is not None and mask.ndim == 3:
+        mask = mask[:, :, 0] if channel_last else mask[0, :, :]
+
+    # Planes without a single valid pixel convolve to nodata, so skip the kernel for them.
+    if nodata and arr.ndim == 2 and not np.any(arr != np.float32(nodata_value)):
+        return np.full(arr.shape, nodata_value, dtype="float32")
 
     if arr.ndim == 2:
         return _convolve_array_2D(
@@ -512,31 +554,29 @@ def convolve_array(
             mask=mask,
         )
 
+    # Gather the neighbourhoods from contiguous channel planes rather than strided views.
+    if channel_last:
+        arr = np.ascontiguousarray(arr.transpose(2, 0, 1))
+
     result = np.zeros((arr.shape), dtype="float32")
 
+    for idx_d in range(arr.shape[0]):
+        if nodata and not np.any(arr[idx_d, :, :] != np.float32(nodata_value)):
+            result[idx_d, :, :] = nodata_value
+            continue
+
+        result[idx_d, :, :] = _convolve_array_2D(
+            arr[idx_d, :, :],
+            offsets,
+            weights,
+            method=method,
+            nodata=nodata,
+            nodata_value=nodata_value,
+            func_value=func_value,
+            mask=mask,
+        )
+
     if channel_last:
-        for idx_d in range(arr.shape[2]):
-            result[:, :, idx_d] = _convolve_array_2D(
-                arr[:, :, idx_d],
-                offsets,
-                weights,
-                method=method,
-                nodata=nodata,
-                nodata_value=nodata_value,
-                func_value=func_value,
-                mask=mask,
-            )
-    else:
-        for idx_d in range(arr.shape[0]):
-            result[idx_d, :, :] = _convolve_array_2D(
-                arr[idx_d, :, :],
-                offsets,
-                weights,
-                method=method,
-                nodata=nodata,
-                nodata_value=nodata_value,
-                func_value=func_value,
-                mask=mask,
-            )
+        result = np.ascontiguousarray(result.transpose(1, 2, 0))
 
     return result
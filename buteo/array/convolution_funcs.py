@@ -109,20 +109,129 @@ def _hood_contrast(
 
     return np.abs(local_max - local_min)
 
+@jit(nopython=True, nogil=True, cache=True)
+def _hood_values_finite(
+    values: np.ndarray,
+) -> bool:
+    """Check that no value is NaN or infinite. Not compiled with fastmath, which assumes finite values."""
+    for idx in range(values.shape[0]):
+        if not np.isfinite(values[idx]):
+            return False
+
+    return True
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def _hood_median_select(
+    values: np.ndarray,
+) -> Union[float, int]:
+    """Get the unweighted median using quickselect on a copy of the values.
+    The values must be finite, NaN compares false in both directions and breaks the partitioning.
+    """
+    size = values.shape[0]
+    selected = values.copy()
+
+    idx_median = size // 2
+    idx_low = 0
+    idx_high = size - 1
+
+    while idx_low < idx_high:
+        pivot = selected[(idx_low + idx_high) // 2]
+        idx_left = idx_low
+        idx_right = idx_high
+
+        while idx_left <= idx_right:
+            while idx_left < idx_high and selected[idx_left] < pivot:
+                idx_left += 1
+            while idx_right > idx_low and selected[idx_right] > pivot:
+                idx_right -= 1
+
+            if idx_left <= idx_right:
+                selected[idx_left], selected[idx_right] = selected[idx_right], selected[idx_left]
+                idx_left += 1
+                idx_right -= 1
+
+        if idx_median <= idx_right:
+            idx_high = idx_right
+        elif idx_median >= idx_left:
+            idx_low = idx_left
+        else:
+            break
+
+    upper = selected[idx_median]
+
+    if size % 2 == 1:
+        return upper
+
+    # Everything left of the median index is smaller or equal, so the lower middle is its maximum.
+    lower = selected[0]
+    for idx in range(1, idx_median):
+        if selected[idx] > lower:
+            lower = selected[idx]
+
+    return lower + 0.5 * (upper - lower)
+
+
 @jit(nopython=True, nogil=True, fastmath=True, cache=True)
 def _hood_quantile(
     values: np.ndarray,
     weights: np.ndarray,
     quantile: float,
 ) -> Union[float, int]:
-    """Get the weighted median."""
-    sort_mask = np.argsort(values)
-    sorted_data = values[sort_mask]
-    sorted_weights = weights[sort_mask]
-    cumsum = np.cumsum(sorted_weights)
-    intersect = (cumsum - (np.float32(0.5) * sorted_weights)) / cumsum[-1]
+    """Get the weighted quantile.
+
+    Neighbourhoods are small, so an insertion sort on a copy of the values
+    followed by a single interpolating scan is cheaper than argsort, cumsum and interp.
+    """
+    size = values.shape[0]
+
+    # With equal weights and finite values the weighted median is the plain median, which does not need a full sort.
+    if quantile == 0.5 and _hood_values_finite(values):
+        weights_uniform = True
+        for idx in range(1, size):
+            if weights[idx] != weights[0]:
+                weights_uniform = False
+                break
+
+        if weights_uniform:
+            return _hood_median_select(values)
+
+    sorted_data = np.empty_like(values)
+    sorted_weights = np.empty_like(weights)
+
+    weights_total = 0.0
+    for idx in range(size):
+        value = values[idx]
+        weight = weights[idx]
+        weights_total += weight
 
-    return np.interp(quantile, intersect, sorted_data)
+        idx_insert = idx
+        while idx_insert > 0 and sorted_data[idx_insert - 1] > value:
+            sorted_data[idx_insert] = sorted_data[idx_insert - 1]
+            sorted_weights[idx_insert] = sorted_weights[idx_insert - 1]
+            idx_insert -= 1
+
+        sorted_data[idx_insert] = value
+        sorted_weights[idx_insert] = weight
+
+    # Walk the weighted midpoints of each value, interpolating like np.interp.
+    cumsum = 0.0
+    intersect_prev = 0.0
+    for idx in range(size):
+        cumsum += sorted_weights[idx]
+        intersect = (cumsum - (0.5 * sorted_weights[idx])) / weights_total
+
+        if quantile < intersect:
+            if idx == 0:
+                return sorted_data[0]
+
+            fraction = (quantile - intersect_prev) / (intersect - intersect_prev)
+
+            return sorted_data[idx - 1] + fraction * (sorted_data[idx] - sorted_data[idx - 1])
+
+        intersect_prev = intersect
+
+    return sorted_data[size - 1]
 
 
 @jit(nopython=True, nogil=True, fastmath=True, cache=True)
@@ -194,7 +303,7 @@ def _k_to_size(size: int) -> int:
     return int(np.rint(-0.0000837834 * size ** 2 + 0.045469 * size + 0.805733))
 
 
-@jit(nopython=True, parallel=True, nogil=True, fastmath=True, cache=True)
+@jit(nopython=True, nogil=True, fastmath=True, cache=True)
 def _hood_sigma_lee(
     values: np.ndarray,
     weights: np.ndarray,
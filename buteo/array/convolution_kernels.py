@@ -1,6 +1,7 @@
 """### Perform convolutions on arrays.  ###"""
 
 # Standard Library
+from functools import lru_cache
 from typing import Tuple
 
 # External
@@ -279,6 +280,38 @@ def kernel_base(
     return kernel
 
 
+@lru_cache(maxsize=32)
+def _kernel_base_offsets_and_weights(
+    radius: float,
+    circular: bool = False,
+    distance_weighted: bool = False,
+    normalised: bool = True,
+    hole: bool = False,
+    method: int = 0,
+    decay: float = 0.2,
+    sigma: float = 2.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Internal. Cached `kernel_base` followed by `kernel_get_offsets_and_weights`.
+    The returned arrays are shared between calls, so they are read-only.
+    """
+    kernel = kernel_base(
+        radius,
+        circular=circular,
+        distance_weighted=distance_weighted,
+        normalised=normalised,
+        hole=hole,
+        method=method,
+        decay=decay,
+        sigma=sigma,
+    )
+    offsets, weights = kernel_get_offsets_and_weights(kernel)
+
+    offsets.flags.writeable = False
+    weights.flags.writeable = False
+
+    return offsets, weights
+
+
 
 @jit(nopython=True, nogil=True, cache=True, fastmath=True, inline='always')
 def kernel_shift(
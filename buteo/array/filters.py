@@ -10,7 +10,7 @@ import numpy as np
 
 # Internal
 from buteo.array.convolution import convolve_array
-from buteo.array.convolution_kernels import kernel_base, kernel_get_offsets_and_weights
+from buteo.array.convolution_kernels import _kernel_base_offsets_and_weights, kernel_get_offsets_and_weights
 from buteo.utils.utils_base import _type_check
 
 
@@ -44,7 +44,7 @@ def filter_operation(
     _type_check(distance_sigma, [int, float], "distance_sigma")
 
     if kernel is None:
-        kernel = kernel_base(
+        offsets, weights = _kernel_base_offsets_and_weights(
             radius,
             circular=spherical,
             distance_weighted=distance_weighted,
@@ -54,8 +54,8 @@ def filter_operation(
             decay=distance_decay,
             sigma=distance_sigma,
         )
-
-    offsets, weights = kernel_get_offsets_and_weights(kernel)
+    else:
+        offsets, weights = kernel_get_offsets_and_weights(kernel)
 
     arr = arr.astype(np.float32, copy=False)
 
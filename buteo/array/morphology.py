@@ -10,7 +10,7 @@ import numpy as np
 
 # Internal
 from buteo.array.convolution import convolve_array
-from buteo.array.convolution_kernels import kernel_base, kernel_get_offsets_and_weights
+from buteo.array.convolution_kernels import _kernel_base_offsets_and_weights
 from buteo.utils.utils_base import _type_check
 
 
@@ -27,8 +27,7 @@ def _morphology_operation(
     _type_check(spherical, [bool], "spherical")
     _type_check(channel_last, [bool], "channel_last")
 
-    kernel = kernel_base(radius, circular=spherical, normalised=False)
-    offsets, weights = kernel_get_offsets_and_weights(kernel)
+    offsets, weights = _kernel_base_offsets_and_weights(radius, circular=spherical, normalised=False)
 
     mask = None
     if np.ma.isMaskedArray(arr):
@@ -301,7 +301,7 @@ def _merge_weighted_olympic(
     return ret_arr
 
 
-@jit(nopython=True, parallel=True, nogil=True)
+@jit(nopython=True, parallel=True, nogil=True, cache=True)
 def _merge_weighted_mad(
     arr: np.ndarray,
     arr_weight: np.ndarray,
@@ -384,7 +384,7 @@ def _merge_weighted_mad(
     return ret_arr
 
 
-@jit(nopython=True, nogil=True)
+@jit(nopython=True, nogil=True, cache=True)
 def _unique_values(arr: np.ndarray) -> np.ndarray:
     """Find the unique values in a 1D NumPy array.
 
@@ -408,7 +408,7 @@ def _unique_values(arr: np.ndarray) -> np.ndarray:
     return unique[:unique_count]
 
 
-@jit(nopython=True, parallel=True, nogil=True)
+@jit(nopython=True, parallel=True, nogil=True, cache=True)
 def _merge_weighted_mode(
     arr: np.ndarray,
     arr_weight: np.ndarray,
@@ -584,12 +584,12 @@ def _borders_are_necessary_list(
     return height_border, width_border
 
 
-def _array_to_patches_single(
+def _array_to_patches_view(
     arr: np.ndarray,
     tile_size: int,
     offset: Optional[Union[List[int], Tuple[int, int]]] = None,
 ) -> np.ndarray:
-    """Generate patches from an array. Offsets in (y, x) order.
+    """Generate a view of the patches in an array, without copying any data. Offsets in (y, x) order.
 
     Parameters
     ----------
@@ -605,7 +605,7 @@ def _array_to_patches_single(
     Returns
     -------
     np.ndarray
-        A numpy array containing the patches.
+        A read-only view of the patches in the order (patches_y, patches_x, y, x, channels).
     """
     assert arr.ndim in [2, 3], "Array must be 2D or 3D"
     assert tile_size > 0, "Tile size must be greater than 0"
@@ -615,32 +615,54 @@ def _array_to_patches_single(
     if offset is None:
         offset = [0, 0]
 
+    if arr.ndim == 2:
+        arr = arr[:, :, np.newaxis]
+
     # Calculate the number of patches in the y and x dimensions
     patches_y = (arr.shape[0] - offset[0]) // tile_size
     patches_x = (arr.shape[1] - offset[1]) // tile_size
 
-    # Calculate cut dimensions for the y and x dimensions
-    cut_y = -((arr.shape[0] - offset[0]) % tile_size)
-    cut_x = -((arr.shape[1] - offset[1]) % tile_size)
-
-    # Set cut dimensions to None if they are 0
-    cut_y = None if cut_y == 0 else cut_y
-    cut_x = None if cut_x == 0 else cut_x
+    # The strides of the patch grid are whole tiles, so the view works for any memory layout.
+    stride_y, stride_x, stride_c = arr.strides
 
-    # Reshape the array to separate the patches
-    reshaped = arr[offset[0]:cut_y, offset[1]:cut_x].reshape(
-        patches_y,
-        tile_size,
-        patches_x,
-        tile_size,
-        arr.shape[2],
+    view = np.lib.stride_tricks.as_strided(
+        arr[offset[0]:, offset[1]:],
+        shape=(patches_y, patches_x, tile_size, tile_size, arr.shape[2]),
+        strides=(stride_y * tile_size, stride_x * tile_size, stride_y, stride_x, stride_c),
+        writeable=False,
     )
 
-    # Swap axes to rearrange patches in the correct order
-    swaped = reshaped.swapaxes(1, 2)
+    return view
 
-    # Combine the patches into a single array
-    blocks = swaped.reshape(-1, tile_size, tile_size, arr.shape[2])
+
+def _array_to_patches_single(
+    arr: np.ndarray,
+    tile_size: int,
+    offset: Optional[Union[List[int], Tuple[int, int]]] = None,
+) -> np.ndarray:
+    """Generate patches from an array. Offsets in (y, x) order.
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        The array to be divided into patches.
+
+    tile_size : int
+        The size of each tile/patch, e.g., 64 for 64x64 tiles.
+
+    offset : Optional[Union[List[int], Tuple[int, int]]], optional
+        The y and x offset values for the input array. If not provided, defaults to [0, 0].
+
+    Returns
+    -------
+    np.ndarray
+        A numpy array containing the patches.
+    """
+    view = _array_to_patches_view(arr, tile_size, offset)
+
+    # Copy the view once, straight into a contiguous array of patches
+    blocks = np.empty((view.shape[0] * view.shape[1],) + view.shape[2:], dtype=arr.dtype)
+    blocks.reshape(view.shape)[:] = view
 
     return blocks
 
@@ -651,6 +673,7 @@ def _patches_to_array_single(
     tile_size: int,
     offset: Optional[Union[List, Tuple]] = None,
     background_value: Optional[Union[int, float]] = None,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """Reconstitute an array from patches.
 
@@ -674,6 +697,10 @@ def _patches_to_array_single(
     background_value : Optional[Union[int, float]], optional
         The value to use for the background. If not provided, defaults to np.nan.
 
+    out : Optional[np.ndarray], optional
+        A preallocated array of the specified shape to write the result into.
+        If not provided, a new array is created. Default: None
+
     Returns
     -------
     np.ndarray
@@ -684,16 +711,20 @@ def _patches_to_array_single(
     assert patches.shape[1] == tile_size, "Patches must be of size tile_size"
     assert patches.shape[2] == tile_size, "Patches must be of size tile_size"
     assert offset is None or len(offset) == 2, "Offset must be a tuple or list of length 2"
+    assert out is None or tuple(out.shape) == tuple(shape), "Out must have the specified shape"
 
     # Set default offset to [0, 0] if not provided
     if offset is None:
         offset = [0, 0]
 
-    # Create an empty target array of the specified shape
-    if background_value is None:
-        target = np.full(shape, np.nan, dtype=patches.dtype)
-    else:
+    background_value = np.nan if background_value is None else background_value
+
+    # Create an empty target array of the specified shape, or reuse the provided one
+    if out is None:
         target = np.full(shape, background_value, dtype=patches.dtype)
+    else:
+        target = out
+        np.copyto(target, background_value, casting="unsafe")
 
     # Calculate target dimensions
     target_y = ((shape[0] - offset[0]) // tile_size) * tile_size
@@ -737,29 +768,14 @@ def _patches_to_array_single(
     return target
 
 
-def _patches_to_weights(
-    patches: np.ndarray,
-    edge_distance: int,
-) -> np.ndarray:
-    """Calculate the weights for each patch based on the distance to the edge."""
-    assert len(patches.shape) == 4, "Patches must be a 4D array"
-    assert patches.shape[1] == patches.shape[2], "Patches must be square"
-
-    # Calculate the distance to the edge for each patch
-    weights = _get_kernel_weights(patches.shape[1], edge_distance)
-
-    # Expand the weights to match the number of patches
-    weights = np.repeat(weights[np.newaxis, ...], patches.shape[0], axis=0)[..., np.newaxis]
-
-    return weights
-
-
 def array_to_patches(
     arr: np.ndarray,
     tile_size: int, *,
     n_offsets: int = 0,
     border_check: bool = True,
     channel_last: bool = True,
+    out_path: Optional[str] = None,
+    dtype: Optional[Union[str, np.dtype]] = None,
 ) -> np.ndarray:
     """Generate patches from an array based on the specified parameters.
 
@@ -780,6 +796,14 @@ def array_to_patches(
     channel_last : bool, optional
         Whether or not the channel dimension is the last dimension. Default: True
 
+    out_path : Optional[str], optional
+        If provided, the patches are written straight to this .npy file as they are cut, instead of
+        being held in memory, and the memory-mapped file is returned. Default: None
+
+    dtype : Optional[Union[str, np.dtype]], optional
+        The datatype of the patches. The values are cast as the patches are copied, so no converted copy of the
+        full array is made. Values are cast, not rescaled. If None, the datatype of the array is used. Default: None
+
     Returns
     -------
     np.ndarray
@@ -797,6 +821,9 @@ def array_to_patches(
     assert n_offsets >= 0, "Number of offsets must be greater than or equal to 0"
     assert isinstance(border_check, bool), "Border check must be a boolean"
     assert isinstance(n_offsets, int), "Number of offsets must be an integer"
+    assert out_path is None or isinstance(out_path, str), "out_path must be a string or None"
+
+    dtype = arr.dtype if dtype is None else np.dtype(dtype)
 
     if not channel_last:
         arr = channel_first_to_last(arr)
@@ -813,19 +840,31 @@ def array_to_patches(
             offsets.append((arr.shape[0] - tile_size, 0))
             offsets.append((arr.shape[0] - tile_size, arr.shape[1] - tile_size))
 
-    # Initialize an empty list to store the generated patches
-    patches = []
+    # Size the output from the patch views first, so every patch is copied once, straight into place
+    views = [_array_to_patches_view(arr, tile_size, offset) for offset in offsets]
+    n_patches = sum(view.shape[0] * view.shape[1] for view in views)
 
-    # Iterate through the offsets and generate patches for each offset
-    for offset in offsets:
-        patches.append(
-            _array_to_patches_single(arr, tile_size, offset),
-        )
+    # The output is allocated in its final layout, so channel first patches are written without a transpose copy
+    if channel_last:
+        out_shape = (n_patches, tile_size, tile_size, arr.shape[2])
+    else:
+        out_shape = (n_patches, arr.shape[2], tile_size, tile_size)
+
+    if out_path is None:
+        patches = np.empty(out_shape, dtype=dtype)
+    else:
+        patches = np.lib.format.open_memmap(out_path, mode="w+", dtype=dtype, shape=out_shape)
 
-    patches = np.concatenate(patches, axis=0)
+    patches_channel_last = patches if channel_last else patches.transpose(0, 2, 3, 1)
 
-    if not channel_last:
-        patches = channel_last_to_first(patches)
+    idx_start = 0
+    for view in views:
+        idx_end = idx_start + view.shape[0] * view.shape[1]
+        patches_channel_last[idx_start:idx_end].reshape(view.shape)[:] = view
+        idx_start = idx_end
+
+    if out_path is not None:
+        patches.flush()
 
     return patches
 
@@ -920,37 +959,46 @@ def predict_array(
     predictions = np.zeros((len(offsets), arr.shape[0], arr.shape[1], test_shape[-1]), dtype=arr.dtype)
     predictions_weights = np.zeros((len(offsets), arr.shape[0], arr.shape[1], 1), dtype=np.float32)
 
+    # Every patch gets the same weights, so the kernel is computed once instead of once per batch
+    if edge_weighted:
+        kernel_weights = _get_kernel_weights(tile_size, edge_distance)[:, :, np.newaxis]
+    else:
+        kernel_weights = np.ones((tile_size, tile_size, 1), dtype=np.float32)
+
     # Iterate through the offsets and generate patches for each offset
     for idx_i, offset in enumerate(offsets):
-        patches = _array_to_patches_single(arr, tile_size, offset)
+        # Patches are only copied out of the view one batch at a time
+        view = _array_to_patches_view(arr, tile_size, offset)
+        n_patches = view.shape[0] * view.shape[1]
 
-        offset_predictions = np.empty((patches.shape[0], patches.shape[1], patches.shape[2], test_shape[-1]), dtype=arr.dtype)
-        offset_weights = np.empty((patches.shape[0], patches.shape[1], patches.shape[2], 1), dtype=np.float32)
-        
-        for idx_j in range((patches.shape[0] // batch_size) + (1 if patches.shape[0] % batch_size != 0 else 0)):
+        offset_predictions = np.empty((n_patches, tile_size, tile_size, test_shape[-1]), dtype=arr.dtype)
+        offset_weights = np.broadcast_to(kernel_weights, (n_patches, tile_size, tile_size, 1))
+
+        for idx_j in range((n_patches // batch_size) + (1 if n_patches % batch_size != 0 else 0)):
             idx_start = idx_j * batch_size
-            idx_end = (idx_j + 1) * batch_size
+            idx_end = min((idx_j + 1) * batch_size, n_patches)
+
+            batch_idx = np.arange(idx_start, idx_end)
+            patches = view[batch_idx // view.shape[1], batch_idx % view.shape[1]]
 
             if not channel_last:
                 prediction = channel_first_to_last(
                     callback(
-                        channel_last_to_first(patches[idx_start:idx_end, ...])
+                        channel_last_to_first(patches)
                     )
                 )
             else:
-                prediction = callback(patches[idx_start:idx_end, ...])
-
-            if edge_weighted:
-                weights = _patches_to_weights(patches[idx_start:idx_end, ...], edge_distance)
-            else:
-                weights = np.ones((tile_size, tile_size, 1), dtype=np.float32)
-                weights = np.repeat(weights[np.newaxis, ...], batch_size, axis=0)
+                prediction = callback(patches)
 
             offset_predictions[idx_start:idx_end, ...] = prediction
-            offset_weights[idx_start:idx_end, ...] = weights
 
-        predictions[idx_i, :, :, :] = _patches_to_array_single(offset_predictions, (arr.shape[0], arr.shape[1], test_shape[-1]), tile_size, offset)
-        predictions_weights[idx_i, :, :, :] = _patches_to_array_single(offset_weights, (arr.shape[0], arr.shape[1], 1), tile_size, offset, 0.0)
+        # Stitch directly into the merge buffers instead of through full-size temporaries
+        _patches_to_array_single(
+            offset_predictions, (arr.shape[0], arr.shape[1], test_shape[-1]), tile_size, offset, out=predictions[idx_i],
+        )
+        _patches_to_array_single(
+            offset_weights, (arr.shape[0], arr.shape[1], 1), tile_size, offset, 0.0, out=predictions_weights[idx_i],
+        )
 
     # Merge the predictions
     if merge_method == "mad":
@@ -7,7 +7,7 @@ TODO:
 
 import xml.etree.ElementTree as ET
 from datetime import datetime
-from typing import Union, List, Tuple, Dict, Any
+from typing import Union, List, Dict, Any
 import numpy as np
 
 
@@ -103,3 +103,36 @@ def s1_to_intensity(
     10^(arr/10)
     """
     return np.power(10, arr / 10.0)
+
+
+def s1_db_to_int16(
+    arr: np.ndarray,
+    nodata_value: Union[int, float, None] = None,
+) -> np.ndarray:
+    """Quantize dB to int16 as round(dB * 100)
+    Non-finite values and `nodata_value` are set to -32768. Halves the memory of float32 backscatter.
+    """
+    arr = np.asarray(arr)
+    invalid = ~np.isfinite(arr)
+
+    if nodata_value is not None:
+        invalid |= arr == nodata_value
+
+    quantized = np.empty(arr.shape, dtype=np.int16)
+    np.clip(np.rint(np.where(invalid, 0.0, arr) * 100.0), -32767, 32767, out=quantized, casting="unsafe")
+    quantized[invalid] = -32768
+
+    return quantized
+
+
+def s1_int16_to_db(
+    arr: np.ndarray,
+    nodata_value: Union[int, float] = np.nan,
+) -> np.ndarray:
+    """Convert int16 quantized dB back to float32 dB
+    arr / 100, with -32768 set to `nodata_value`.
+    """
+    db = np.multiply(arr, np.float32(0.01), dtype=np.float32)
+    db[arr == -32768] = nodata_value
+
+    return db
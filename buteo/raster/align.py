@@ -10,7 +10,8 @@ import sys; sys.path.append("../../")
 from typing import List, Union, Optional
 
 # External
-from osgeo import gdal
+import numpy as np
+from osgeo import gdal, ogr
 
 # Internal
 from buteo.utils import (
@@ -247,20 +248,36 @@ def _raster_find_best_align_reference(
         if not utils_path._check_is_valid_output_filepath(out_path, overwrite=True):
             raise ValueError(f"Invalid out_path: {out_path}")
 
+    # Parse every latlng boundary once. The full geometry test only runs for pairs whose latlng bounding
+    # boxes overlap, and only once per pair, as intersection is symmetric.
+    metadata_list = [core_raster._get_basic_metadata_raster(raster) for raster in input_rasters]
+    bboxes = np.array([metadata["bbox_latlng"] for metadata in metadata_list], dtype=np.float64)
+    geoms = [
+        ogr.CreateGeometryFromWkt(metadata["bounds_latlng"], metadata["projection_osr"])
+        for metadata in metadata_list
+    ]
+
+    # Sweep over the boxes sorted by x_min. The candidates for each box are the boxes that start after it,
+    # but before its x_max, so boxes far apart along x are never compared.
+    order = np.argsort(bboxes[:, 0], kind="stable")
+    sorted_bboxes = bboxes[order]
+    sweep_ends = np.searchsorted(sorted_bboxes[:, 0], sorted_bboxes[:, 1], side="right")
+
+    intersects = np.zeros((len(input_rasters), len(input_rasters)), dtype=bool)
+    for idx_sorted, idx_i in enumerate(order):
+        candidates = sorted_bboxes[idx_sorted + 1:sweep_ends[idx_sorted]]
+        overlap_y = (candidates[:, 2] <= bboxes[idx_i, 3]) & (candidates[:, 3] >= bboxes[idx_i, 2])
+
+        for idx_j in order[idx_sorted + 1:sweep_ends[idx_sorted]][overlap_y]:
+            if geoms[idx_i].Intersects(geoms[idx_j]):
+                intersects[idx_i, idx_j] = True
+                intersects[idx_j, idx_i] = True
+
     # Count intersections
     most_intersections = 0
     intersections_arr = []
-    for idx_i, raster_i in enumerate(input_rasters):
-        intersections = 0
-        for idx_j, raster_j in enumerate(input_rasters):
-            if idx_i == idx_j:
-                continue
-
-            # Uses the latlng bounding box to determine if the rasters intersect.
-            intersection = core_raster.check_rasters_intersect(raster_i, raster_j)
-
-            if intersection:
-                intersections += 1
+    for idx_i in range(len(input_rasters)):
+        intersections = int(intersects[idx_i].sum())
 
         if intersections > most_intersections:
             most_intersections = intersections
@@ -272,8 +289,7 @@ def _raster_find_best_align_reference(
     largest_area_idx = 0
     for idx, intersection in enumerate(intersections_arr):
         if intersection == most_intersections:
-            raster = input_rasters[idx]
-            raster_area = core_raster._get_basic_metadata_raster(raster)["area_latlng"]
+            raster_area = metadata_list[idx]["area_latlng"]
 
             if raster_area > largest_area:
                 largest_area = raster_area
@@ -292,10 +308,11 @@ def _raster_find_best_align_reference(
 
         all_other_rasters.append(raster_path)
 
-    for raster in all_other_rasters:
-        assert core_raster.check_rasters_intersect(best_reference, raster), (
-            f"Rasters {best_reference} and {raster} do not intersect."
-        )
+    for idx, raster in enumerate(input_path_list):
+        if idx != largest_area_idx and raster != best_reference:
+            assert intersects[largest_area_idx, idx], (
+                f"Rasters {best_reference} and {raster} do not intersect."
+            )
 
     if method == "reference":
         return best_reference
@@ -313,7 +330,14 @@ def _raster_find_best_align_reference(
         raster_meta = core_raster._get_basic_metadata_raster(raster_path)
         raster_geom = raster_meta["geom"]
 
-        if not raster_geom.Intersects(best_geom):
+        # For intersections, an empty result doubles as the Intersects test.
+        if method == "union":
+            geom_intersects = raster_geom.Intersects(best_geom)
+        else:
+            intersection = raster_geom.Intersection(best_geom)
+            geom_intersects = not intersection.IsEmpty()
+
+        if not geom_intersects:
             raise ValueError(
                 f"Raster {raster_path} did not intersect. Consider not using bbox='intersection'"
             )
@@ -321,7 +345,7 @@ def _raster_find_best_align_reference(
         if method == "union":
             best_geom = raster_geom.Union(best_geom)
         else:
-            best_geom = raster_geom.Intersection(best_geom)
+            best_geom = intersection
 
     bbox_best_geom = best_geom.GetEnvelope()
 
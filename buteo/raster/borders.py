@@ -8,7 +8,7 @@ Useful for warped satellite images and for proximity searching.
 
 # Standard library
 import sys; sys.path.append("../../")
-from typing import Union, List, Optional, Any
+from typing import Union, List, Optional
 
 # External
 import numpy as np
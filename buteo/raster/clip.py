@@ -5,7 +5,7 @@ Clips a raster using a vector geometry or the extents of a raster.
 
 # Standard library
 import sys; sys.path.append("../../")
-from typing import Union, List, Optional
+from typing import Union, List, Optional, Tuple, Dict, Any
 from warnings import warn
 
 # External
@@ -20,48 +20,24 @@ from buteo.utils import (
     utils_bbox,
     utils_path,
     utils_translate,
+    utils_projection,
 )
 from buteo.raster import core_raster
 from buteo.vector import core_vector
 from buteo.vector.reproject import _vector_reproject
 
 
-def _raster_clip(
-    raster: Union[str, List[str], gdal.Dataset, List[gdal.Dataset]],
-    clip_geom: Union[str, gdal.Dataset, ogr.DataSource, ogr.Layer, List[ogr.Layer], List[ogr.DataSource], List[gdal.Dataset]],
-    out_path: Optional[Union[str, List[str]]] = None,
+def _raster_clip_prepare_geom(
+    clip_geom: Union[str, gdal.Dataset, ogr.DataSource, ogr.Geometry],
     *,
-    resample_alg: str = "nearest",
-    crop_to_geom: bool = True,
-    adjust_bbox: bool = True,
-    all_touch: bool = True,
-    to_extent: bool = False,
-    overwrite: bool = True,
-    creation_options: Optional[List] = None,
-    dst_nodata: str = "infer",
-    src_nodata: str = "infer",
     layer_to_clip: int = 0,
-    prefix: str = "",
-    suffix: str = "",
-    verbose: int = 1,
-    ram: float = 0.8,
-    ram_max: Optional[int] = None,
-    ram_min: Optional[int] = 100,
-):
+    to_extent: bool = False,
+) -> Tuple[str, Dict[str, Any], List]:
     """INTERNAL.
-    Clips a raster(s) using a vector geometry or the extents of a raster.
-    """
-    path_list = utils_io._get_output_paths(
-        raster,
-        out_path,
-        prefix=prefix,
-        suffix=suffix,
-        add_uuid=out_path is None,
-    )
-    assert utils_path._check_is_valid_output_path_list(path_list, overwrite), (
-        f"Unable to parse out_path: {out_path}"
-    )
+    Opens the clip geometry and turns it into a single layer cutline.
 
+    Returns the cutline, its metadata and the list of in-memory datasets created along the way.
+    """
     clip_ds = None
 
     memory_files = []
@@ -101,6 +77,59 @@ def _raster_clip(
     if clip_ds is None:
         raise ValueError(f"Unable to parse input clip geom: {clip_geom}")
 
+    return clip_ds, clip_metadata, memory_files
+
+
+def _raster_clip(
+    raster: Union[str, List[str], gdal.Dataset, List[gdal.Dataset]],
+    clip_geom: Union[str, gdal.Dataset, ogr.DataSource, ogr.Layer, List[ogr.Layer], List[ogr.DataSource], List[gdal.Dataset]],
+    out_path: Optional[Union[str, List[str]]] = None,
+    *,
+    resample_alg: str = "nearest",
+    crop_to_geom: bool = True,
+    adjust_bbox: bool = True,
+    all_touch: bool = True,
+    to_extent: bool = False,
+    overwrite: bool = True,
+    creation_options: Optional[List] = None,
+    dst_nodata: str = "infer",
+    src_nodata: str = "infer",
+    layer_to_clip: int = 0,
+    prefix: str = "",
+    suffix: str = "",
+    verbose: int = 1,
+    ram: float = 0.8,
+    ram_max: Optional[int] = None,
+    ram_min: Optional[int] = 100,
+    clip_metadata: Optional[Dict[str, Any]] = None,
+):
+    """INTERNAL.
+    Clips a raster(s) using a vector geometry or the extents of a raster.
+
+    If `clip_metadata` is provided, `clip_geom` is taken to be an already prepared
+    single layer cutline in the projection of the raster, and is used as is.
+    """
+    path_list = utils_io._get_output_paths(
+        raster,
+        out_path,
+        prefix=prefix,
+        suffix=suffix,
+        add_uuid=out_path is None,
+    )
+    assert utils_path._check_is_valid_output_path_list(path_list, overwrite), (
+        f"Unable to parse out_path: {out_path}"
+    )
+
+    if clip_metadata is None:
+        clip_ds, clip_metadata, memory_files = _raster_clip_prepare_geom(
+            clip_geom,
+            layer_to_clip=layer_to_clip,
+            to_extent=to_extent,
+        )
+    else:
+        clip_ds = clip_geom
+        memory_files = []
+
     # options
     warp_options = []
     if all_touch:
@@ -338,21 +367,48 @@ def raster_clip(
     )
     utils_path._delete_if_required_list(out_path_list, overwrite)
 
+    # Parse the clip geometry once, and reproject it once per projection, instead of once per raster.
+    clip_ds, _clip_metadata, memory_files = _raster_clip_prepare_geom(
+        clip_geom,
+        layer_to_clip=layer_to_clip,
+        to_extent=to_extent,
+    )
+    clip_ds_projected = {}
+
+    # Resolve the creation options once for the whole batch
+    creation_options = utils_gdal._get_default_creation_options(creation_options)
+
     output = []
     for index, in_raster in enumerate(input_rasters):
+        raster_projection = utils_projection._get_projection_from_raster(in_raster)
+        raster_projection_wkt = raster_projection.ExportToWkt()
+
+        if raster_projection_wkt not in clip_ds_projected:
+            clip_ds_reprojected = _vector_reproject(clip_ds, raster_projection, add_uuid=True)
+
+            if clip_ds_reprojected != clip_ds:
+                memory_files.append(clip_ds_reprojected)
+
+            clip_ds_projected[raster_projection_wkt] = (
+                clip_ds_reprojected,
+                core_vector._get_basic_metadata_vector(clip_ds_reprojected),
+            )
+
+        clip_ds_raster, clip_metadata_raster = clip_ds_projected[raster_projection_wkt]
+
         output.append(
             _raster_clip(
                 in_raster,
-                clip_geom,
+                clip_ds_raster,
                 out_path=out_path_list[index],
                 resample_alg=resample_alg,
                 crop_to_geom=crop_to_geom,
                 adjust_bbox=adjust_bbox,
                 all_touch=all_touch,
-                to_extent=to_extent,
+                to_extent=False,
                 dst_nodata=dst_nodata,
                 src_nodata=src_nodata,
-                layer_to_clip=layer_to_clip,
+                layer_to_clip=0,
                 overwrite=overwrite,
                 creation_options=creation_options,
                 prefix=prefix,
@@ -361,9 +417,12 @@ def raster_clip(
                 ram=ram,
                 ram_max=ram_max,
                 ram_min=ram_min,
+                clip_metadata=clip_metadata_raster,
             )
         )
 
+    utils_gdal.delete_dataset_if_in_memory_list(memory_files)
+
     if input_is_list:
         return output
 
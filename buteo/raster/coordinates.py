@@ -50,7 +50,9 @@ def raster_create_grid_with_coordinates(
     x_vals = np.linspace(start_x + x_adj, stop_x - x_adj, size_x, dtype=np.float32)
     y_vals = np.linspace(start_y - y_adj, stop_y + y_adj, size_y, dtype=np.float32)
 
-    xx, yy = np.meshgrid(x_vals, y_vals)
-    grid = np.dstack((xx, yy))
+    # Broadcast the coordinates straight into the output, instead of building two full meshgrids and stacking them
+    grid = np.empty((size_y, size_x, 2), dtype=np.float32)
+    grid[:, :, 0] = x_vals[np.newaxis, :]
+    grid[:, :, 1] = y_vals[:, np.newaxis]
 
     return grid
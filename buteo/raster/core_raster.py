@@ -3,10 +3,14 @@
 # Standard library
 import sys; sys.path.append("../../")
 import os
-from typing import List, Optional, Union, Dict, Any
+import pickle
+import hashlib
+from typing import List, Optional, Union, Dict, Any, Tuple
+from functools import lru_cache
 import warnings
 
 # External
+import numpy as np
 from osgeo import gdal, ogr, osr
 
 # Internal
@@ -21,6 +25,25 @@ from buteo.utils import (
 )
 
 
+_NETWORK_VSI_PREFIXES = (
+    "/vsicurl/", "/vsis3/", "/vsigs/", "/vsiaz/", "/vsiadls/", "/vsioss/", "/vsiswift/", "/vsihdfs/", "/vsiwebhdfs/",
+)
+
+
+def _type_check_raster(
+    raster: Any,
+    name: str = "raster",
+) -> None:
+    """Internal. A cheap `utils_base._type_check(raster, [str, gdal.Dataset], name)` for functions called once per raster.
+    Raises the same ValueError.
+    """
+    if isinstance(raster, (str, gdal.Dataset)):
+        return
+
+    raise ValueError(
+        f"The type of variable {name} is not valid. Expected: {[str, gdal.Dataset]}, got: {type(raster)}"
+    )
+
 
 def _raster_open(
     raster: Union[str, gdal.Dataset],
@@ -56,9 +79,22 @@ def _raster_open(
 
     if utils_path._check_file_exists(raster):
 
+        # Only probe raster drivers. Listing remote folders for sidecar files is slow, so it is skipped for network paths.
+        # The option is set thread-locally, as rasters are opened from thread pools; GetConfigOption sees both scopes.
+        open_flags = gdal.OF_RASTER | (gdal.OF_UPDATE if writeable else gdal.OF_READONLY)
+        skip_readdir = raster.startswith(_NETWORK_VSI_PREFIXES) and gdal.GetConfigOption("GDAL_DISABLE_READDIR_ON_OPEN") is None
+
+        if skip_readdir:
+            gdal.SetThreadLocalConfigOption("GDAL_DISABLE_READDIR_ON_OPEN", "EMPTY_DIR")
+
         gdal.PushErrorHandler("CPLQuietErrorHandler")
-        opened = gdal.Open(raster, gdal.GF_Write) if writeable else gdal.Open(raster, gdal.GF_Read)
-        gdal.PopErrorHandler()
+        try:
+            opened = gdal.OpenEx(raster, open_flags)
+        finally:
+            gdal.PopErrorHandler()
+
+            if skip_readdir:
+                gdal.SetThreadLocalConfigOption("GDAL_DISABLE_READDIR_ON_OPEN", None)
 
         if not isinstance(opened, gdal.Dataset):
             raise ValueError(f"Input raster is not readable. Received: {raster}")
@@ -89,6 +125,53 @@ def _raster_open(
     raise ValueError(f"Input raster does not exists. Received: {raster}")
 
 
+def _read_nodata_values(
+    raster: Union[str, gdal.Dataset],
+) -> Tuple[Optional[Union[float, int]], ...]:
+    """Internal. Reads the nodata value of every band, without building the rest of the metadata."""
+    dataset = _raster_open(raster)
+    nodata_values = tuple(
+        dataset.GetRasterBand(band).GetNoDataValue() for band in range(1, dataset.RasterCount + 1)
+    )
+
+    dataset = None
+    return nodata_values
+
+
+@lru_cache(maxsize=256)
+def _get_nodata_values_cached(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    inode: int,
+) -> Tuple[Optional[Union[float, int]], ...]:
+    """Internal. The stat fields are only part of the key, so rewritten files are read again."""
+    return _read_nodata_values(path)
+
+
+def _get_nodata_values(
+    raster: Union[str, gdal.Dataset],
+) -> Tuple[Optional[Union[float, int]], ...]:
+    """Gets the nodata value of every band in a raster.
+    Cached on the path and the file's modification time, size, and inode for rasters on disk.
+
+    Parameters
+    ----------
+    raster : str or gdal.Dataset
+        The raster to get the nodata values from.
+
+    Returns
+    -------
+    tuple
+        The nodata value of each band, None for bands without one.
+    """
+    if isinstance(raster, str) and os.path.isfile(raster):
+        stat = os.stat(raster)
+        return _get_nodata_values_cached(raster, stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    return _read_nodata_values(raster)
+
+
 def _get_first_nodata_value(
     raster: Union[str, gdal.Dataset],
 ) -> Optional[Union[float, int]]:
@@ -104,28 +187,147 @@ def _get_first_nodata_value(
     float or None
         The nodata value if found, or None if not found.
     """
-    utils_base._type_check(raster, [str, gdal.Dataset], "raster")
+    _type_check_raster(raster)
 
-    nodata = None
+    for nodata_value in _get_nodata_values(raster):
+        if nodata_value is not None:
+            return nodata_value
 
-    dataset = _raster_open(raster)
-    band_count = dataset.RasterCount
-    for band in range(1, band_count + 1):
-        band_ref = dataset.GetRasterBand(band)
-        nodata_value = band_ref.GetNoDataValue()
+    return None
 
-        if nodata_value is not None:
-            nodata = nodata_value
-            break
 
-    dataset = None
-    return nodata
+_OSR_CACHE: Dict[str, osr.SpatialReference] = {}
 
 
-def _get_basic_metadata_raster(
+def _get_osr_from_wkt(wkt: str) -> osr.SpatialReference:
+    """Internal. Returns a shared osr.SpatialReference for a WKT string, only importing each WKT once per process.
+    The returned object is shared, so it must not be modified.
+    """
+    if wkt not in _OSR_CACHE:
+        projection_osr = osr.SpatialReference()
+        projection_osr.ImportFromWkt(wkt)
+        _OSR_CACHE[wkt] = projection_osr
+
+    return _OSR_CACHE[wkt]
+
+
+class _RasterMetadata(dict):
+    """A raster metadata dictionary where the projection object and the latlng fields are computed on first access.
+    Reprojecting the bounding box is the expensive part of reading metadata, and most callers never need it.
+    """
+    _lazy_keys = ("projection_osr", "bbox_latlng", "bounds_latlng", "centroid_latlng", "area_latlng")
+
+    def __init__(self, *args, source: Optional["_RasterMetadata"] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._source = source
+
+    def __missing__(self, key):
+        if key not in self._lazy_keys:
+            raise KeyError(key)
+
+        if self._source is not None:
+            value = self._source[key]
+            dict.__setitem__(self, key, list(value) if isinstance(value, list) else value)
+
+        elif key == "projection_osr":
+            dict.__setitem__(self, "projection_osr", _get_osr_from_wkt(self["projection_wkt"]))
+
+        else:
+            self._compute_latlng()
+
+        return dict.__getitem__(self, key)
+
+    def _compute_latlng(self) -> None:
+        projection_osr = self["projection_osr"]
+        bbox = self["bbox"]
+
+        try:
+            bbox_latlng = utils_projection.reproject_bbox(bbox, projection_osr, utils_projection._get_default_projection_osr())
+        except RuntimeError as e:
+            # Catch domain errors which happen if the point requested is outside the projection domain
+            # We set the latlng bbox to the default projection domain
+            if e.args[0] == "Point outside of projection domain":
+                bbox_latlng = [0.0, 90.0, 0.0, 180.0]
+            else:
+                raise e
+        try:
+            bounds_latlng = utils_bbox._get_bounds_from_bbox(bbox, projection_osr, wkt=False)
+        except RuntimeError as e:
+            if e.args[0] == "Point outside of projection domain":
+                bounds_latlng = utils_bbox._get_bounds_from_bbox(bbox_latlng, utils_projection._get_default_projection_osr(), wkt=False)
+            else:
+                raise e
+
+        if projection_osr.IsGeographic():
+            centroid = self["centroid"]
+            centroid_latlng = (centroid[1], centroid[0])
+        else:
+            _centroid_latlng = bounds_latlng.Centroid()
+            centroid_latlng = (_centroid_latlng.GetY(), _centroid_latlng.GetX())
+
+        dict.__setitem__(self, "bbox_latlng", bbox_latlng)
+        dict.__setitem__(self, "bounds_latlng", bounds_latlng.ExportToWkt())
+        dict.__setitem__(self, "centroid_latlng", centroid_latlng)
+        dict.__setitem__(self, "area_latlng", bounds_latlng.GetArea())
+
+    def _resolve(self) -> None:
+        for key in self._lazy_keys:
+            if not dict.__contains__(self, key):
+                self.__missing__(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._lazy_keys or dict.__contains__(self, key)
+
+    def __iter__(self):
+        self._resolve()
+        return dict.__iter__(self)
+
+    def __len__(self) -> int:
+        self._resolve()
+        return dict.__len__(self)
+
+    def __eq__(self, other) -> bool:
+        self._resolve()
+        if isinstance(other, _RasterMetadata):
+            other._resolve()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other) -> bool:
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        self._resolve()
+        return dict.__repr__(self)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def keys(self):
+        self._resolve()
+        return dict.keys(self)
+
+    def values(self):
+        self._resolve()
+        return dict.values(self)
+
+    def items(self):
+        self._resolve()
+        return dict.items(self)
+
+    def copy(self) -> "_RasterMetadata":
+        """Shallow copy. Lists are copied, and lazy fields are taken from this dictionary once computed."""
+        return _RasterMetadata(
+            {key: list(value) if isinstance(value, list) else value for key, value in dict.items(self)},
+            source=self,
+        )
+
+
+def _get_basic_metadata_raster_uncached(
     raster: Union[str, gdal.Dataset],
 ) -> Dict[str, Any]:
-    """Get basic metadata from a raster.
+    """Get basic metadata from a raster, always reading it from GDAL.
 
     Parameters
     ----------
@@ -137,36 +339,13 @@ def _get_basic_metadata_raster(
     Dict[str]
         A dictionary with the metadata.
     """
-    utils_base._type_check(raster, [str, gdal.Dataset], "raster")
-
     dataset = _raster_open(raster, writeable=False, default_projection=3857)
     transform = dataset.GetGeoTransform()
 
     projection_wkt = dataset.GetProjectionRef()
-    projection_osr = osr.SpatialReference()
-    projection_osr.ImportFromWkt(projection_wkt)
 
     bbox = utils_bbox._get_bbox_from_geotransform(transform, dataset.RasterXSize, dataset.RasterYSize)
-    try:
-        bbox_latlng = utils_projection.reproject_bbox(bbox, projection_osr, utils_projection._get_default_projection_osr())
-    except RuntimeError as e:
-        # Catch domain errors which happen if the point requested is outside the projection domain
-        # We set the latlng bbox to the default projection domain
-        if e.args[0] == "Point outside of projection domain":
-            bbox_latlng = [0.0, 90.0, 0.0, 180.0]
-        else:
-            raise e
-    try:
-        bounds_latlng = utils_bbox._get_bounds_from_bbox(bbox, projection_osr, wkt=False)
-    except RuntimeError as e:
-        if e.args[0] == "Point outside of projection domain":
-            bounds_latlng = utils_bbox._get_bounds_from_bbox(bbox_latlng, utils_projection._get_default_projection_osr(), wkt=False)
-        else:
-            raise e
-
-    bounds_area = bounds_latlng.GetArea()
     area = (bbox[1] - bbox[0]) * (bbox[3] - bbox[2])
-    bounds_wkt = bounds_latlng.ExportToWkt()
     bounds_raster_raw = utils_bbox._get_geom_from_bbox(bbox)
     bounds_raster = bounds_raster_raw.ExportToWkt()
     first_band = dataset.GetRasterBand(1)
@@ -175,17 +354,13 @@ def _get_basic_metadata_raster(
 
     _centroid = bounds_raster_raw.Centroid()
     centroid = (_centroid.GetX(), _centroid.GetY())
-    if projection_osr.IsGeographic():
-        centroid_latlng = (centroid[1], centroid[0])
-    else:
-        _centroid_latlng = bounds_latlng.Centroid()
-        centroid_latlng = (_centroid_latlng.GetY(), _centroid_latlng.GetX())
 
     # Paths
     path = utils_path._get_unix_path(dataset.GetDescription())
     in_memory = utils_path._check_is_valid_mem_filepath(path)
 
-    metadata = {
+    # projection_osr, bbox_latlng, bounds_latlng, centroid_latlng, and area_latlng are computed on first access
+    metadata = _RasterMetadata({
         "path": path,
         "basename": os.path.basename(path),
         "name": os.path.splitext(os.path.basename(path))[0],
@@ -193,7 +368,6 @@ def _get_basic_metadata_raster(
         "ext": os.path.splitext(path)[1],
         "in_memory": in_memory,
         "driver": dataset.GetDriver().ShortName,
-        "projection_osr": projection_osr,
         "projection_wkt": projection_wkt,
         "geotransform": transform,
         "size": (dataset.RasterXSize, dataset.RasterYSize),
@@ -207,11 +381,8 @@ def _get_basic_metadata_raster(
         "origin_x": transform[0],
         "origin_y": transform[3],
         "centroid": centroid,
-        "centroid_latlng": centroid_latlng,
         "bbox": bbox,
         "bbox_gdal": utils_bbox._get_gdal_bbox_from_ogr_bbox(bbox),
-        "bbox_latlng": bbox_latlng,
-        "bounds_latlng": bounds_wkt,
         "bounds_raster": bounds_raster,
         "x_min": bbox[0],
         "x_max": bbox[1],
@@ -221,9 +392,8 @@ def _get_basic_metadata_raster(
         "dtype_gdal": dtype,
         "dtype": dtype_numpy,
         "dtype_name": dtype_numpy.name,
-        "area_latlng": bounds_area,
         "area": area,
-    }
+    })
 
     x_min, x_max, y_min, y_max = bbox
     metadata["area"] = (x_max - x_min) * (y_max - y_min)
@@ -244,6 +414,79 @@ def _get_basic_metadata_raster(
     return metadata
 
 
+@lru_cache(maxsize=256)
+def _get_basic_metadata_raster_cached(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    inode: int,
+) -> Dict[str, Any]:
+    """Internal. The stat fields are only part of the key, so rewritten files are read again.
+
+    If the `BUTEO_METADATA_CACHE_DIR` environment variable is set, the metadata is also pickled
+    to that folder, so later processes can skip opening the raster.
+    """
+    cache_dir = os.environ.get("BUTEO_METADATA_CACHE_DIR")
+
+    if cache_dir is None:
+        return _get_basic_metadata_raster_uncached(path)
+
+    key = hashlib.sha1(f"{path}|{os.path.abspath(path)}|{mtime_ns}|{size}|{inode}".encode("utf-8")).hexdigest()
+    cache_path = os.path.join(cache_dir, f"{key}.pkl")
+
+    try:
+        with open(cache_path, "rb") as f:
+            return _RasterMetadata(pickle.load(f))
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    metadata = _get_basic_metadata_raster_uncached(path)
+
+    # The lazy fields hold OSR and OGR objects, which cannot be pickled. They are recomputed on access.
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        cache_path_tmp = f"{cache_path}.{os.getpid()}.tmp"
+        with open(cache_path_tmp, "wb") as f:
+            pickle.dump({k: v for k, v in dict.items(metadata) if k not in _RasterMetadata._lazy_keys}, f)
+        os.replace(cache_path_tmp, cache_path)
+    except OSError:
+        pass
+
+    return metadata
+
+
+def _get_basic_metadata_raster(
+    raster: Union[str, gdal.Dataset],
+) -> Dict[str, Any]:
+    """Get basic metadata from a raster.
+
+    Metadata for rasters on disk is cached on the path and its modification time,
+    size, and inode. Datasets and in-memory rasters are always read.
+
+    Parameters
+    ----------
+    raster : str or gdal.Dataset
+        The raster to get the metadata from.
+
+    Returns
+    -------
+    Dict[str]
+        A dictionary with the metadata.
+    """
+    _type_check_raster(raster)
+
+    if isinstance(raster, str) and os.path.isfile(raster):
+        stat = os.stat(raster)
+        metadata = _get_basic_metadata_raster_cached(
+            raster, stat.st_mtime_ns, stat.st_size, stat.st_ino,
+        )
+
+        # Copy, so callers can modify the dictionary without altering the cache.
+        return metadata.copy()
+
+    return _get_basic_metadata_raster_uncached(raster)
+
+
 def _get_basic_metadata_raster_list(
     rasters: List[Union[str, gdal.Dataset]],
 ) -> List[Dict[str, Any]]:
@@ -283,13 +526,9 @@ def _check_raster_has_nodata(
     bool
         True if raster has nodata values, False otherwise.
     """
-    utils_base._type_check(raster, [str, gdal.Dataset], "raster")
-
-    metadata = _get_basic_metadata_raster(raster)
-    if metadata["nodata"]:
-        return True
+    _type_check_raster(raster)
 
-    return False
+    return _get_first_nodata_value(raster) is not None
 
 
 def _check_raster_has_nodata_list(
@@ -311,9 +550,8 @@ def _check_raster_has_nodata_list(
 
     rasters = utils_io._get_input_paths(rasters, "raster")
 
-    metadata = _get_basic_metadata_raster_list(rasters)
-    for meta in metadata:
-        if meta["nodata"]:
+    for raster in rasters:
+        if _get_first_nodata_value(raster) is not None:
             return True
 
     return False
@@ -365,16 +603,29 @@ def check_rasters_have_same_nodata(
 
     rasters = utils_io._get_input_paths(rasters, "raster")
 
-    metadata = _get_basic_metadata_raster_list(rasters)
-
-    nodata_value = metadata[0]["nodata_value"]
-    for meta in metadata[1:]:
-        if meta["nodata_value"] != nodata_value:
+    # Only the nodata values are needed, and the loop stops at the first mismatch.
+    nodata_value = _get_first_nodata_value(rasters[0])
+    for raster in rasters[1:]:
+        if _get_first_nodata_value(raster) != nodata_value:
             return False
 
     return True
 
 
+def _get_raster_latlng_geometries(
+    raster1: Union[str, gdal.Dataset],
+    raster2: Union[str, gdal.Dataset],
+) -> Tuple[ogr.Geometry, ogr.Geometry]:
+    """Internal. Reads the metadata of two rasters once and returns their latlng boundaries as geometries."""
+    meta_1 = _get_basic_metadata_raster(raster1)
+    meta_2 = _get_basic_metadata_raster(raster2)
+
+    geom_1 = ogr.CreateGeometryFromWkt(meta_1["bounds_latlng"], meta_1["projection_osr"])
+    geom_2 = ogr.CreateGeometryFromWkt(meta_2["bounds_latlng"], meta_2["projection_osr"])
+
+    return geom_1, geom_2
+
+
 def check_rasters_intersect(
     raster1: Union[str, gdal.Dataset],
     raster2: Union[str, gdal.Dataset],
@@ -397,11 +648,7 @@ def check_rasters_intersect(
     utils_base._type_check(raster1, [str, gdal.Dataset], "raster1")
     utils_base._type_check(raster2, [str, gdal.Dataset], "raster2")
 
-    meta_1 = _get_basic_metadata_raster(raster1)
-    meta_2 = _get_basic_metadata_raster(raster2)
-
-    geom_1 = ogr.CreateGeometryFromWkt(meta_1["bounds_latlng"], meta_1["projection_osr"])
-    geom_2 = ogr.CreateGeometryFromWkt(meta_2["bounds_latlng"], meta_2["projection_osr"])
+    geom_1, geom_2 = _get_raster_latlng_geometries(raster1, raster2)
 
     # Do the layers intersect?
     intersect = geom_1.Intersects(geom_2)
@@ -433,21 +680,14 @@ def get_raster_intersection(
     utils_base._type_check(raster1, [str, gdal.Dataset], "raster1")
     utils_base._type_check(raster2, [str, gdal.Dataset], "raster2")
 
-    if not check_rasters_intersect(raster1, raster2):
-        raise ValueError("Rasters do not intersect.")
-
-    meta_1 = _get_basic_metadata_raster(raster1)
-    meta_2 = _get_basic_metadata_raster(raster2)
+    geom_1, geom_2 = _get_raster_latlng_geometries(raster1, raster2)
 
-    geom_1 = ogr.CreateGeometryFromWkt(meta_1["bounds_latlng"], meta_1["projection_osr"])
-    geom_2 = ogr.CreateGeometryFromWkt(meta_2["bounds_latlng"], meta_2["projection_osr"])
+    # The intersection is only empty when the rasters do not intersect, so no separate Intersects test is needed.
+    intersection = geom_1.Intersection(geom_2)
 
-    if not geom_1.Intersects(geom_2):
+    if intersection.IsEmpty():
         raise ValueError("Rasters do not intersect.")
 
-    # Get the intersection.
-    intersection = geom_1.Intersection(geom_2)
-
     return intersection
 
 
@@ -474,41 +714,32 @@ def get_raster_overlap_fraction(
     utils_base._type_check(raster1, [str, gdal.Dataset, [str, gdal.Dataset]], "raster1")
     utils_base._type_check(raster2, [str, gdal.Dataset, [str, gdal.Dataset]], "raster2")
 
-    if not check_rasters_intersect(raster1, raster2):
-        return 0.0
-
-    meta_1 = _get_basic_metadata_raster(raster1)
-    meta_2 = _get_basic_metadata_raster(raster2)
-
-    geom_1 = ogr.CreateGeometryFromWkt(meta_1["bounds_latlng"], meta_1["projection_osr"])
-    geom_2 = ogr.CreateGeometryFromWkt(meta_2["bounds_latlng"], meta_2["projection_osr"])
-
-    if not geom_1.Intersects(geom_2):
-        return 0.0
+    geom_1, geom_2 = _get_raster_latlng_geometries(raster1, raster2)
 
     try:
         intersection = geom_1.Intersection(geom_2)
-        overlap = intersection.GetArea() / geom_1.GetArea()
+        overlap = 0.0 if intersection.IsEmpty() else intersection.GetArea() / geom_1.GetArea()
     except RuntimeError:
         overlap = 0.0
 
     return overlap
 
 
-def check_rasters_are_aligned(
-    rasters: List[Union[str, gdal.Dataset]],
+def _check_raster_metadata_are_aligned(
+    metadata_list: List[Dict[str, Any]],
     *,
     same_dtype: bool = False,
     same_nodata: bool = False,
     same_bands: bool = False,
     threshold: float = 0.0001,
 ) -> bool:
-    """Verifies whether a list of rasters are aligned.
+    """Verifies whether already read raster metadata describes aligned rasters.
+    Lets callers that hold the metadata check alignment without opening the rasters again.
 
     Parameters
     ----------
-    rasters : list
-        A list of rasters, either in gdal.Dataset or a string referring to the dataset.
+    metadata_list : list
+        A list of metadata dictionaries, as returned by `_get_basic_metadata_raster`.
 
     same_dtype : bool, optional
         If True, all the rasters should have the same data type. Default: False.
@@ -516,6 +747,9 @@ def check_rasters_are_aligned(
     same_nodata : bool, optional
         If True, all the rasters should have the same nodata value. Default: False.
 
+    same_bands : bool, optional
+        If True, all the rasters should have the same number of bands. Default: False.
+
     threshold : float, optional
         The threshold for the difference between the rasters. Default: 0.0001.
 
@@ -524,53 +758,31 @@ def check_rasters_are_aligned(
     bool
         True if rasters are aligned and optional parameters are True, False otherwise.
     """
-    utils_base._type_check(rasters, [[str, gdal.Dataset]], "rasters")
-    utils_base._type_check(same_dtype, [bool], "same_dtype")
-    utils_base._type_check(same_nodata, [bool], "same_nodata")
-    utils_base._type_check(threshold, [float], "threshold")
+    metadata_base = metadata_list[0]
 
-    if len(rasters) == 0:
-        raise ValueError("Input is an empty list.")
-
-    if len(rasters) == 1:
+    if len(metadata_list) == 1:
         return True
 
-    assert utils_gdal._check_is_raster_list(rasters), "Input is not a list of valid rasters."
-
-    # Get the metadata of the first raster
-    metadata_base = _get_basic_metadata_raster(rasters[0])
-
-    for raster in rasters[1:]:
-        # Get the metadata of the current raster
-        metadata_current = _get_basic_metadata_raster(raster)
-
-        # Check if the same amount of pixels
-        if not metadata_base["size"][0] == metadata_current["size"][0] and metadata_base["size"][1] == metadata_current["size"][1]:
-            return False
-
-        # Check if the projections are the same
-        if not metadata_base["projection_osr"].IsSame(metadata_current["projection_osr"]):
-            return False
-
-        # Check if origin is the same
-        origin_base = metadata_base["origin"]
-        origin_current = metadata_current["origin"]
-
-        if not utils_base._check_number_is_within_threshold(origin_base[0], origin_current[0], threshold):
-            return False
-
-        if not utils_base._check_number_is_within_threshold(origin_base[1], origin_current[1], threshold):
-            return False
-
-        # Check if the pixel size is the same
-        pixel_size_base = metadata_base["pixel_size"]
-        pixel_size_current = metadata_current["pixel_size"]
-
-        if not utils_base._check_number_is_within_threshold(pixel_size_base[0], pixel_size_current[0], threshold):
-            return False
-
-        if not utils_base._check_number_is_within_threshold(pixel_size_base[1], pixel_size_current[1], threshold):
-            return False
+    # Compare the numeric geometry of all rasters against the first one in a single pass.
+    # Columns: width, height, x_origin, y_origin, pixel_width, pixel_height.
+    geometry = np.empty((len(metadata_list), 6), dtype=np.float64)
+    for idx, metadata in enumerate(metadata_list):
+        geometry[idx, 0:2] = metadata["size"][:2]
+        geometry[idx, 2:4] = metadata["origin"][:2]
+        geometry[idx, 4:6] = metadata["pixel_size"][:2]
+
+    # The pixel counts must match exactly, the rest within the threshold.
+    thresholds = np.array([0.0, 0.0, threshold, threshold, threshold, threshold], dtype=np.float64)
+
+    if np.any(np.abs(geometry[1:] - geometry[0]) > thresholds):
+        return False
+
+    for metadata_current in metadata_list[1:]:
+        # Check if the projections are the same. This is checked after the cheap numeric fields, and identical
+        # WKT strings skip building and comparing the OSR objects.
+        if metadata_base["projection_wkt"] != metadata_current["projection_wkt"]:
+            if not metadata_base["projection_osr"].IsSame(metadata_current["projection_osr"]):
+                return False
 
         if same_dtype:
             if not metadata_base["dtype"] == metadata_current["dtype"]:
@@ -591,6 +803,67 @@ def check_rasters_are_aligned(
     return True
 
 
+def check_rasters_are_aligned(
+    rasters: List[Union[str, gdal.Dataset]],
+    *,
+    same_dtype: bool = False,
+    same_nodata: bool = False,
+    same_bands: bool = False,
+    threshold: float = 0.0001,
+) -> bool:
+    """Verifies whether a list of rasters are aligned.
+
+    Parameters
+    ----------
+    rasters : list
+        A list of rasters, either in gdal.Dataset or a string referring to the dataset.
+
+    same_dtype : bool, optional
+        If True, all the rasters should have the same data type. Default: False.
+
+    same_nodata : bool, optional
+        If True, all the rasters should have the same nodata value. Default: False.
+
+    threshold : float, optional
+        The threshold for the difference between the rasters. Default: 0.0001.
+
+    Returns
+    -------
+    bool
+        True if rasters are aligned and optional parameters are True, False otherwise.
+    """
+    utils_base._type_check(rasters, [[str, gdal.Dataset]], "rasters")
+    utils_base._type_check(same_dtype, [bool], "same_dtype")
+    utils_base._type_check(same_nodata, [bool], "same_nodata")
+    utils_base._type_check(threshold, [float], "threshold")
+
+    if len(rasters) == 0:
+        raise ValueError("Input is an empty list.")
+
+    if len(rasters) == 1:
+        return True
+
+    assert utils_gdal._check_is_raster_list(rasters), "Input is not a list of valid rasters."
+
+    # Get the metadata of the first raster
+    metadata_list = [_get_basic_metadata_raster(rasters[0])]
+
+    for raster in rasters[1:]:
+        # The same raster is always aligned with itself
+        if raster is rasters[0] or (isinstance(raster, str) and raster == rasters[0]):
+            continue
+
+        metadata_list.append(_get_basic_metadata_raster(raster))
+
+    return _check_raster_metadata_are_aligned(
+        metadata_list,
+        same_dtype=same_dtype,
+        same_nodata=same_nodata,
+        same_bands=same_bands,
+        threshold=threshold,
+    )
+
+
 def raster_to_extent(
     raster: Union[str, gdal.Dataset],
     out_path: Optional[str] = None,
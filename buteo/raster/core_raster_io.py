@@ -1,11 +1,14 @@
 """### Basic IO functions for working with Rasters ###"""
 # Standard library
 import sys; sys.path.append("../../")
+import os
 from typing import List, Optional, Union, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import warnings
 
 # External
 import numpy as np
+from numba import jit, prange
 from osgeo import gdal, ogr, osr
 
 # Internal
@@ -22,6 +25,18 @@ from buteo.raster import core_raster, core_offsets
 
 
 
+@jit(nopython=True, parallel=True, nogil=True, cache=True)
+def _fill_nodata_inplace(
+    arr: np.ndarray,
+    nodata_value: Union[int, float],
+    fill_value: Union[int, float],
+) -> None:
+    """Internal. Replaces every nodata value in a flat array with the fill value, in place."""
+    for idx in prange(arr.size):
+        if arr[idx] == nodata_value:
+            arr[idx] = fill_value
+
+
 def raster_to_array(
     raster: Union[gdal.Dataset, str, List[Union[str, gdal.Dataset]]],
     *,
@@ -157,10 +172,12 @@ def raster_to_array(
 
     raster = utils_io._get_input_paths(raster, "raster")
 
-    assert core_raster.check_rasters_are_aligned(raster), "Rasters are not aligned."
+    # Read metadata once and reuse it for the alignment check, the nodata values, and the band counts
+    metadata_list = core_raster._get_basic_metadata_raster_list(raster)
+    metadata = metadata_list[0]
+
+    assert core_raster._check_raster_metadata_are_aligned(metadata_list), "Rasters are not aligned."
 
-    # Read metadata
-    metadata = core_raster._get_basic_metadata_raster(raster[0])
     shape = metadata["shape"]
     dtype = metadata["dtype"] if cast is None else cast
     dtype = utils_translate._parse_dtype(dtype)
@@ -200,19 +217,17 @@ def raster_to_array(
     bands_to_process = []
     output_shape = shape
     if (isinstance(bands, str) and bands.lower() == "all") or bands == -1:
-        total_channels = core_raster._raster_count_bands_list(raster)
+        total_channels = sum(meta["bands"] for meta in metadata_list)
         output_shape = [y_size, x_size, total_channels]
 
-        for r in raster:
-            meta = core_raster._get_basic_metadata_raster(r)
+        for meta in metadata_list:
             bands_in_raster = meta["bands"]
             bands_to_process.append(
                 utils_gdal._convert_to_band_list(-1, bands_in_raster),
             )
     else:
         channels = 0
-        for r in raster:
-            meta = core_raster._get_basic_metadata_raster(r)
+        for meta in metadata_list:
             bands_in_raster = meta["bands"]
             bands_in_raster_list = utils_gdal._convert_to_band_list(bands, bands_in_raster)
             bands_to_process.append(bands_in_raster_list)
@@ -221,69 +236,111 @@ def raster_to_array(
 
         output_shape = [y_size, x_size, channels]
 
-    # Read data
-    output_array = np.ma.zeros(output_shape, dtype=dtype)
-    channel = 0
-    for idx, r_path in enumerate(raster):
-
-        # We can read all at once
-        if len(raster) == 1 and (bands == "all" or bands == -1) and False == True:
-            r_open = core_raster._raster_open(r_path)
-            data = r_open.ReadAsArray(x_offset, y_offset, x_size, y_size)
-
-            if data.ndim != 3:
-                data = np.expand_dims(data, axis=0)
-
-            data = np.transpose(data, (1, 2, 0))
+    # Read data. The output is allocated in its final layout and GDAL decodes straight into band-first views of it,
+    # so no reordering copy is needed afterwards.
+    if not channel_last:
+        output_shape = [output_shape[2], output_shape[0], output_shape[1]]
 
-            if cast is not None:
-                data = utils_translate._safe_numpy_casting(data, dtype)
+    # When filling, nodata is replaced after the read in one pass, so no mask is needed
+    build_mask = has_nodata and not filled
 
-            output_array = data
+    output_array = np.zeros(output_shape, dtype=dtype)
+    output_mask = np.zeros(output_shape, dtype=bool) if build_mask else None
+    output_bands = output_array.transpose(2, 0, 1) if channel_last else output_array
+    output_mask_bands = None if output_mask is None else (output_mask.transpose(2, 0, 1) if channel_last else output_mask)
+    channel = 0
+    band_jobs = []
+    r_opens = []
+    for idx, r_path in enumerate(raster):
+        r_open = core_raster._raster_open(r_path)
+        r_bands = [r_open.GetRasterBand(n_band) for n_band in bands_to_process[idx]]
+        band_dtypes = [utils_translate._translate_dtype_gdal_to_numpy(band.DataType) for band in r_bands]
+
+        # We can read all bands at once, in a single call, straight into the output array
+        if (
+            len(raster) == 1
+            and r_open.RasterCount > 1
+            and bands_to_process[idx] == list(range(1, r_open.RasterCount + 1))
+            and all(band_dtype == output_array.dtype for band_dtype in band_dtypes)
+        ):
+            r_open.ReadAsArray(x_offset, y_offset, x_size, y_size, buf_obj=output_bands)
+
+            if build_mask:
+                np.equal(output_array, nodata_value, out=output_mask)
+
+            channel += r_open.RasterCount
+            continue
+
+        # We need to read bands one by one. The band handles are fetched once, and their datasets kept open with them.
+        r_opens.append(r_open)
+        for n_band, band, band_dtype in zip(bands_to_process[idx], r_bands, band_dtypes):
+            band_jobs.append((r_path, band, n_band, band_dtype, channel))
+            channel += 1
+
+    def _read_band(band, band_dtype, channel):
+        # Matching dtypes are decoded straight into the output array, no intermediate band array
+        if band_dtype == output_array.dtype:
+            band.ReadAsArray(x_offset, y_offset, x_size, y_size, buf_obj=output_bands[channel])
 
-        # We need to read bands one by one
         else:
-            for n_band in bands_to_process[idx]:
-                r_open = core_raster._raster_open(r_path)
+            data = band.ReadAsArray(x_offset, y_offset, x_size, y_size)
 
-                band = r_open.GetRasterBand(n_band)
-                data = band.ReadAsArray(x_offset, y_offset, x_size, y_size)
-
-                if cast is not None:
-                    output_array[:, :, channel] = utils_translate._safe_numpy_casting(data, dtype)
-                else:
-                    output_array[:, :, channel] = data
-
-                channel += 1
-
-    if has_nodata:
-        output_array = np.ma.masked_equal(output_array, nodata_value)
+            if cast is not None:
+                output_bands[channel] = utils_translate._safe_numpy_casting(data, dtype)
+            else:
+                output_bands[channel] = data
 
-        if filled:
-            if fill_value is None:
-                fill_value = nodata_value
+        # Build the mask one band at a time, straight into the preallocated buffer
+        if build_mask:
+            np.equal(output_bands[channel], nodata_value, out=output_mask_bands[channel])
 
-                if not utils_translate._check_is_value_within_dtype_range(fill_value, dtype):
-                    warnings.warn(
-                        f"Fill value {fill_value} is outside of dtype {dtype} range. "
-                        "Setting fill value to 0."
-                    )
-                    fill_value = 0
+    def _read_band_in_thread(r_path, n_band, band_dtype, channel):
+        # Datasets are not thread-safe, so each thread opens its own. GDAL's own decoding threads would oversubscribe the cores.
+        gdal.SetThreadLocalConfigOption("GDAL_NUM_THREADS", "1")
+        r_open_thread = core_raster._raster_open(r_path)
+        _read_band(r_open_thread.GetRasterBand(n_band), band_dtype, channel)
 
-            output_array = np.ma.getdata(output_array.filled(fill_value))
+    # Large reads of several bands from paths are spread over threads, as GDAL releases the GIL while decoding.
+    if len(band_jobs) > 1 and x_size * y_size >= 1_000_000 and all(isinstance(job[0], str) for job in band_jobs):
+        with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(band_jobs))) as executor:
+            futures = [
+                executor.submit(_read_band_in_thread, r_path, n_band, band_dtype, channel)
+                for r_path, _band, n_band, band_dtype, channel in band_jobs
+            ]
 
-    elif filled:
-        np.nan_to_num(data, nan=fill_value, copy=False)
+            for future in futures:
+                future.result()
 
     else:
-        output_array = np.ma.getdata(output_array)
+        for _r_path, band, _n_band, band_dtype, channel in band_jobs:
+            _read_band(band, band_dtype, channel)
+
+    if has_nodata and filled:
+        if fill_value is None:
+            fill_value = nodata_value
+
+            if not utils_translate._check_is_value_within_dtype_range(fill_value, dtype):
+                warnings.warn(
+                    f"Fill value {fill_value} is outside of dtype {dtype} range. "
+                    "Setting fill value to 0."
+                )
+                fill_value = 0
+
+        fill_value = np.array(fill_value, dtype=output_array.dtype)
+
+        # Fill in place in a single fused compare-and-write pass. The output is contiguous, so the flat reshape is a view.
+        # Numba has no float16 support, so those arrays use NumPy.
+        if output_array.dtype == np.float16:
+            np.copyto(output_array, fill_value, where=output_array == nodata_value)
+        else:
+            _fill_nodata_inplace(output_array.reshape(-1), nodata_value[()], fill_value[()])
 
-    if filled and np.ma.isMaskedArray(output_array):
-        output_array = np.ma.getdata(output_array.filled(fill_value))
+    elif filled and fill_value is not None:
+        np.nan_to_num(output_array, nan=fill_value, copy=False)
 
-    # Reshape array
-    if not channel_last:
-        output_array = np.transpose(output_array, (2, 0, 1))
+    if has_nodata and not filled:
+        output_array = np.ma.masked_where(output_mask, output_array, copy=False)
+        output_array.fill_value = nodata_value
 
     if input_is_list:
         return output_array
@@ -304,6 +361,7 @@ def array_to_raster(
     channel_last: bool = True,
     overwrite: bool = True,
     creation_options: Optional[List[str]] = None,
+    compression: Optional[str] = None,
 ):
     """Turns a NumPy array into a GDAL dataset or exported as a raster using a reference raster.
 
@@ -353,6 +411,10 @@ def array_to_raster(
         List of GDAL creation options. Default: ["TILED=YES", "NUM_THREADS=ALL_CPUS",
         "BIGTIFF=YES", "COMPRESS=LZW"].
 
+    compression : str, optional
+        The compression to use when none is set in the creation options. One of "lzw", "deflate",
+        "zstd", "lerc_zstd" or "none". A PREDICTOR matching the datatype is added. If None, LZW is used. Default: None.
+
     Returns
     -------
     str
@@ -390,6 +452,7 @@ def array_to_raster(
     utils_base._type_check(channel_last, [bool], "channel_last")
     utils_base._type_check(overwrite, [bool], "overwrite")
     utils_base._type_check(creation_options, [list, None], "creation_options")
+    utils_base._type_check(compression, [str, None], "compression")
 
     if isinstance(set_nodata, str) and set_nodata not in ["arr", "ref"]:
         raise ValueError("set_nodata must be either 'arr' or 'ref'.")
@@ -439,10 +502,11 @@ def array_to_raster(
     if set_nodata == "arr":
         if np.ma.isMaskedArray(array):
             destination_nodata = True
-            destination_nodata = array.fill_value
+            destination_nodata_value = array.fill_value
+            array = np.ma.getdata(array.filled(destination_nodata_value))
         else:
             destination_nodata = False
-            destination_nodata = None
+            destination_nodata_value = None
     elif set_nodata == "ref":
         destination_nodata = metadata_ref["nodata"]
         destination_nodata_value = metadata_ref["nodata_value"]
@@ -501,7 +565,7 @@ def array_to_raster(
         y_size,
         bands,
         utils_translate._translate_dtype_numpy_to_gdal(array.dtype),
-        utils_gdal._get_default_creation_options(creation_options),
+        utils_gdal._get_default_creation_options(creation_options, compression=compression, dtype=array.dtype),
     )
 
     if destination is None:
@@ -510,15 +574,10 @@ def array_to_raster(
     destination.SetGeoTransform(destination_transform)
     destination.SetProjection(metadata_ref["projection_wkt"])
 
-    for band_idx in range(bands):
-        band = destination.GetRasterBand(band_idx + 1)
+    destination_bands = [destination.GetRasterBand(band_idx + 1) for band_idx in range(bands)]
+    for band in destination_bands:
         band.SetColorInterpretation(gdal.GCI_Undefined)
 
-        if bands > 1 or array.ndim == 3:
-            band.WriteArray(array[:, :, band_idx])
-        else:
-            band.WriteArray(array)
-
         if destination_nodata:
             if utils_base._check_variable_is_int(destination_nodata_value):
                 band.SetNoDataValue(int(destination_nodata_value))
@@ -527,6 +586,29 @@ def array_to_raster(
             else:
                 band.SetNoDataValue(np.nan)
 
+    if array.ndim == 2:
+        array = array[:, :, np.newaxis]
+
+    # Write one window at a time, all bands of it before moving on. With pixel interleaved, compressed
+    # outputs, a block is then compressed once, instead of being reloaded and recompressed for every band.
+    # Striped outputs (untiled GTiff, MEM) report blocks a single row tall, so their rows are grouped into
+    # strips of about 64 MB, to avoid a write call per row. Only tiled outputs are written block by block.
+    block_x, block_y = destination_bands[0].GetBlockSize()
+
+    if block_x >= x_size:
+        block_x = x_size
+        row_bytes = max(1, x_size * bands * array.itemsize)
+        block_y = max(block_y, ((64 * 1024 * 1024) // row_bytes) // block_y * block_y)
+
+    for y_offset in range(0, y_size, block_y):
+        y_end = min(y_offset + block_y, y_size)
+
+        for x_offset in range(0, x_size, block_x):
+            x_end = min(x_offset + block_x, x_size)
+
+            for band_idx, band in enumerate(destination_bands):
+                band.WriteArray(array[y_offset:y_end, x_offset:x_end, band_idx], x_offset, y_offset)
+
     destination.FlushCache()
     destination = None
 
@@ -673,6 +755,10 @@ class raster_to_array_chunks:
     cast : type or str, optional
         The data type to cast the output to. Default: None.
 
+    prefetch : bool, optional
+        If True, the next chunk is read in a background thread while the current
+        chunk is being processed, overlapping disk reads with computation. Default: False.
+
     Returns
     -------
     generator
@@ -711,6 +797,7 @@ class raster_to_array_chunks:
         border_strategy: int = 1,
         cast: Optional[Union[np.dtype, str]] = None,
         channel_last: bool = True,
+        prefetch: bool = False,
     ):
         self.raster = raster
         self.chunks = chunks
@@ -724,6 +811,10 @@ class raster_to_array_chunks:
         self.cast = cast
         self.current_chunk = 0
         self.channel_last = channel_last
+        self.prefetch = prefetch
+
+        self._executor = None
+        self._prefetched = None
 
         self.shape = core_raster._get_basic_metadata_raster(self.raster)["shape"]
 
@@ -757,29 +848,55 @@ class raster_to_array_chunks:
 
         self.total_chunks = len(self.offsets)
 
+    def _read_chunk(self, offset: List[int]) -> np.ndarray:
+        return raster_to_array(
+            self.raster,
+            bands=self.bands,
+            filled=self.filled,
+            fill_value=self.fill_value,
+            pixel_offsets=offset,
+            cast=self.cast,
+            channel_last=self.channel_last,
+        )
+
+    def _close_executor(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+        self._executor = None
+        self._prefetched = None
+
     def __iter__(self):
+        self._close_executor()
         self.current_chunk = 0
         return self
 
     def __next__(self) -> Tuple[np.ndarray, List[int]]:
         if self.current_chunk >= self.total_chunks:
+            self._close_executor()
             raise StopIteration
 
         offset = self.offsets[self.current_chunk]
         self.current_chunk += 1 + self.skip
 
-        return (
-            raster_to_array(
-                self.raster,
-                bands=self.bands,
-                filled=self.filled,
-                fill_value=self.fill_value,
-                pixel_offsets=offset,
-                cast=self.cast,
-                channel_last=self.channel_last,
-            ),
-            offset,
-        )
+        if not self.prefetch:
+            return (self._read_chunk(offset), offset)
+
+        # A single worker keeps all reads of the dataset on one thread.
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+
+        if self._prefetched is None:
+            chunk = self._read_chunk(offset)
+        else:
+            chunk = self._prefetched.result()
+
+        if self.current_chunk < self.total_chunks:
+            self._prefetched = self._executor.submit(self._read_chunk, self.offsets[self.current_chunk])
+        else:
+            self._prefetched = None
+
+        return (chunk, offset)
 
     def __len__(self):
         return self.total_chunks
@@ -922,6 +1039,7 @@ def raster_create_from_array(
     channel_last: bool = True,
     overwrite: bool = True,
     creation_options: Union[List[str], None] = None,
+    nodata_value: Optional[Union[float, int]] = None,
 ) -> str:
     """Create a raster from a numpy array.
 
@@ -946,11 +1064,18 @@ def raster_create_from_array(
        The projection of the output raster. Default: "EPSG:3857".
 
         creation_options : list or None, optional
-       The creation options for the output raster. Default: None.
+       The creation options for the output raster. A PREDICTOR matching the datatype is added
+       unless one is given. For elevation data, "COMPRESS=LERC_ZSTD" with a "MAX_Z_ERROR"
+       compresses far better, within a controlled error. Default: None.
 
         overwrite : bool, optional
        If True, the output raster will be overwritten if it already exists. Default: True.
 
+        nodata_value : int or float or None, optional
+       The nodata value to set on the output raster. Pixels already holding this value are
+       treated as nodata, so no masked array is needed. Overrides the fill value of a
+       masked array. Default: None.
+
         Returns
         -------
         str
@@ -964,13 +1089,14 @@ def raster_create_from_array(
     utils_base._type_check(projection, [int, str, gdal.Dataset, ogr.DataSource, osr.SpatialReference], "projection")
     utils_base._type_check(creation_options, [[str], None], "creation_options")
     utils_base._type_check(overwrite, [bool], "overwrite")
+    utils_base._type_check(nodata_value, [int, float, None], "nodata_value")
 
     assert arr.ndim in [2, 3], "Array must be 2 or 3 dimensional (3rd dimension considered bands.)"
 
+    # GDAL writes band first arrays. Channel first input is used as is, channel last input as a transposed view.
     if arr.ndim == 2:
-        arr = arr[:, :, np.newaxis]
-
-    if not channel_last:
+        arr = arr[np.newaxis, :, :]
+    elif channel_last:
         arr = np.transpose(arr, (2, 0, 1))
 
     if out_path is not None and not utils_path._check_is_valid_output_filepath(out_path, overwrite=overwrite):
@@ -987,7 +1113,7 @@ def raster_create_from_array(
 
     utils_path._delete_if_required(out_path, overwrite)
 
-    height, width, bands = arr.shape
+    bands, height, width = arr.shape
 
     destination = driver.Create(
         out_path,
@@ -995,7 +1121,7 @@ def raster_create_from_array(
         height,
         bands,
         utils_translate._translate_dtype_numpy_to_gdal(arr.dtype),
-        utils_gdal._get_default_creation_options(creation_options),
+        utils_gdal._add_predictor_creation_option(utils_gdal._get_default_creation_options(creation_options), arr.dtype),
     )
 
     parsed_projection = utils_projection.parse_projection(projection, return_wkt=True)
@@ -1009,20 +1135,25 @@ def raster_create_from_array(
 
     destination.SetGeoTransform(transform)
 
-    nodata = None
-    nodata_value = 0.0
+    nodata = nodata_value is not None
 
     if isinstance(arr, np.ma.MaskedArray):
-        nodata = True
-        nodata_value = arr.fill_value
+        if not nodata:
+            nodata = True
+            nodata_value = arr.fill_value
+
         arr = np.ma.getdata(arr.filled(nodata_value))
 
-    for idx in range(0, bands):
-        dst_band = destination.GetRasterBand(idx + 1)
-        dst_band.WriteArray(arr[:, :, idx])
+    if nodata:
+        for idx in range(0, bands):
+            destination.GetRasterBand(idx + 1).SetNoDataValue(nodata_value)
 
-        if nodata:
-            dst_band.SetNoDataValue(nodata_value)
+    # Write all bands in a single dataset level call. GDAL follows the strides of the array, so a transposed
+    # (height, width, bands) array is written as is, pixel interleaved, without a contiguous copy of every band.
+    destination.WriteArray(arr, 0, 0)
+
+    destination.FlushCache()
+    destination = None
 
     return out_path
 
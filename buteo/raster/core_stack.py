@@ -2,7 +2,14 @@
 
 # Standard library
 import sys; sys.path.append("../../")
+import os
+import re
+import queue
+import threading
 from typing import Union, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+import warnings
+from xml.sax.saxutils import escape as xml_escape
 
 # External
 from osgeo import gdal
@@ -12,13 +19,182 @@ import numpy as np
 from buteo.utils import (
     utils_io,
     utils_base,
+    utils_gdal,
     utils_path,
     utils_translate,
 )
-from buteo.raster import core_raster, core_raster_io
+from buteo.raster import core_raster
 
 
 
+def _raster_iterate_blocks(
+    raster: str,
+    dtype: np.dtype,
+    reuse_buffer: bool = False,
+):
+    """Internal. Yields `(x_offset, y_offset, block)` for every block window of a raster, following its block layout.
+    The block holds all bands of the window, band interleaved as (bands, height, width), converted to dtype.
+    With reuse_buffer, every block is read into the same memory, so it must be consumed before the next one is read.
+    """
+    source = core_raster._raster_open(raster)
+    x_size, y_size, bands = source.RasterXSize, source.RasterYSize, source.RasterCount
+    block_x, block_y = source.GetRasterBand(1).GetBlockSize()
+    buffer = np.empty(bands * min(block_y, y_size) * min(block_x, x_size), dtype=dtype) if reuse_buffer else None
+
+    for y_offset in range(0, y_size, block_y):
+        y_window = min(block_y, y_size - y_offset)
+
+        for x_offset in range(0, x_size, block_x):
+            x_window = min(block_x, x_size - x_offset)
+
+            # A view of the start of the flat buffer is contiguous for the edge windows as well
+            if buffer is not None:
+                window = buffer[:bands * y_window * x_window].reshape(bands, y_window, x_window)
+            else:
+                window = np.empty((bands, y_window, x_window), dtype=dtype)
+
+            # All bands in one dataset level read, so a pixel interleaved block is decoded once
+            source.ReadAsArray(x_offset, y_offset, x_window, y_window, buf_obj=window)
+
+            yield x_offset, y_offset, window
+
+
+def _raster_stack_read_blocks(
+    raster: str,
+    source_idx: int,
+    dtype: np.dtype,
+    blocks: queue.Queue,
+    cancel: threading.Event,
+) -> None:
+    """Internal. Reads the blocks of a raster in a worker thread and queues them for the writer.
+    Puts None on the queue when done, also on errors, which are raised through the future.
+    """
+    # The dataset is opened in this thread, and GDAL's own decoding threads would oversubscribe the cores.
+    gdal.SetThreadLocalConfigOption("GDAL_NUM_THREADS", "1")
+
+    try:
+        for x_offset, y_offset, data in _raster_iterate_blocks(raster, dtype):
+            if cancel.is_set():
+                return
+
+            blocks.put((source_idx, x_offset, y_offset, data))
+    finally:
+        blocks.put(None)
+        gdal.SetThreadLocalConfigOption("GDAL_NUM_THREADS", None)
+
+
+def _raster_stack_list_translate(
+    input_data: List[str],
+    metadata_list: List[dict],
+    out_path: str,
+    out_dtype: np.dtype,
+    out_nodata: Optional[float],
+    creation_options: List[str],
+) -> str:
+    """Internal. Stacks the rasters in an in-memory VRT and copies it to out_path with gdal.Translate.
+    GDAL does the whole copy and the datatype conversion in C, block by block, without a roundtrip through NumPy.
+    """
+    metadata_ref = metadata_list[0]
+
+    # Build the VRT band by band, as BuildVRT only takes the first band of each raster when separating before GDAL 3.8.
+    vrt = gdal.GetDriverByName("VRT").Create("", metadata_ref["width"], metadata_ref["height"], 0)
+    vrt.SetGeoTransform(metadata_ref["geotransform"])
+    vrt.SetProjection(metadata_ref["projection_wkt"])
+
+    for raster in input_data:
+        source = core_raster._raster_open(raster)
+
+        for band_idx in range(1, source.RasterCount + 1):
+            vrt.AddBand(source.GetRasterBand(band_idx).DataType)
+            vrt_band = vrt.GetRasterBand(vrt.RasterCount)
+            vrt_band.SetMetadataItem(
+                "source_0",
+                (
+                    "<SimpleSource>"
+                    f'<SourceFilename relativeToVRT="0">{xml_escape(raster)}</SourceFilename>'
+                    f"<SourceBand>{band_idx}</SourceBand>"
+                    "</SimpleSource>"
+                ),
+                "new_vrt_sources",
+            )
+            vrt_band.SetColorInterpretation(gdal.GCI_Undefined)
+
+            if out_nodata is not None:
+                vrt_band.SetNoDataValue(out_nodata)
+
+        source = None
+
+    destination = gdal.Translate(
+        out_path,
+        vrt,
+        format="GTiff",
+        outputType=utils_translate._translate_dtype_numpy_to_gdal(out_dtype),
+        creationOptions=creation_options,
+    )
+
+    if destination is None:
+        raise RuntimeError(f"Could not create output raster: {out_path}")
+
+    destination.FlushCache()
+    destination = None
+    vrt = None
+
+    return out_path
+
+
+def _raster_stack_list_parallel(
+    input_data: List[str],
+    metadata_list: List[dict],
+    out_path: str,
+    out_dtype: np.dtype,
+    out_nodata: Optional[float],
+    creation_options: List[str],
+    overwrite: bool,
+) -> str:
+    """Internal. Writes every band of the stack to its own GeoTIFF, concurrently, and stacks them in a VRT at out_path.
+    A single GeoTIFF cannot be written from several threads, but separate files can.
+    """
+    nodata = "none" if out_nodata is None else out_nodata
+
+    jobs = []
+    for raster, metadata in zip(input_data, metadata_list):
+        for band in range(1, metadata["bands"] + 1):
+            part_path = utils_path._get_augmented_path(out_path, suffix=f"_part_{len(jobs)}", change_ext="tif")
+            utils_path._delete_if_required(part_path, overwrite)
+            jobs.append((raster, band, part_path))
+
+    def _write_part(raster, band, part_path):
+        part = gdal.Translate(
+            part_path,
+            core_raster._raster_open(raster),
+            format="GTiff",
+            bandList=[band],
+            outputType=utils_translate._translate_dtype_numpy_to_gdal(out_dtype),
+            creationOptions=creation_options,
+            noData=nodata,
+        )
+
+        if part is None:
+            raise RuntimeError(f"Could not write band {band} of {raster} to: {part_path}")
+
+        part = None
+
+        return part_path
+
+    part_paths = utils_gdal._run_in_threads(_write_part, jobs)
+
+    # The parts are single band, so a separate VRT stacks them in order on any GDAL version.
+    vrt = gdal.BuildVRT(out_path, part_paths, options=gdal.BuildVRTOptions(separate=True))
+
+    if vrt is None:
+        raise RuntimeError(f"Could not create the VRT stack: {out_path}")
+
+    vrt.FlushCache()
+    vrt = None
+
+    return out_path
+
+
 def raster_stack_list(
     rasters: List[Union[str, gdal.Dataset]],
     out_path: Optional[str] = None,
@@ -26,6 +202,9 @@ def raster_stack_list(
     overwrite: bool = True,
     dtype: Optional[str] = None,
     creation_options: Optional[List[str]] = None,
+    compression: Optional[str] = None,
+    parallel: bool = False,
+    method: str = "translate",
 ) -> Union[str, List[str]]:
     """Stacks a list of aligned rasters into a single raster file.
 
@@ -47,6 +226,19 @@ def raster_stack_list(
         A list of GDAL creation options for the output raster. Default is
         ["TILED=YES", "NUM_THREADS=ALL_CPUS", "BIGTIFF=YES", "COMPRESS=LZW"].
 
+    compression : str, optional
+        The compression to use when none is set in the creation options. One of "lzw", "deflate",
+        "zstd", "lerc_zstd" or "none". A PREDICTOR matching the datatype is added. If None, LZW is used. Default: None.
+
+    parallel : bool, optional
+        If True, every band is written to its own GeoTIFF concurrently, next to the output, and the output is
+        a .vrt stacking them. Consumers open the VRT like any other raster. Default: False.
+
+    method : str, optional
+        How the bands are copied. "translate" stacks the rasters in an in-memory VRT and lets gdal.Translate copy it,
+        without passing the data through Python. "blocks" copies block windows through NumPy, reading the sources
+        in threads for large stacks. Default: "translate".
+
     Returns
     -------
     str or list
@@ -57,6 +249,12 @@ def raster_stack_list(
     utils_base._type_check(overwrite, [bool], "overwrite")
     utils_base._type_check(dtype, [str, None, np.dtype, type(np.uint8)], "dtype")
     utils_base._type_check(creation_options, [[str], None], "creation_options")
+    utils_base._type_check(compression, [str, None], "compression")
+    utils_base._type_check(parallel, [bool], "parallel")
+    utils_base._type_check(method, [str], "method")
+
+    if method not in ["translate", "blocks"]:
+        raise ValueError(f"method must be either 'translate' or 'blocks', not {method}.")
 
     # Get input raster file paths
     input_data = utils_io._get_input_paths(rasters, "raster")
@@ -72,24 +270,160 @@ def raster_stack_list(
     else:
         assert utils_path._check_is_valid_output_filepath(out_path), "Invalid output path."
 
+    # Always output tif, or a vrt over the written bands when parallel
+    out_path = utils_path._get_augmented_path(out_path, change_ext="vrt" if parallel else "tif")
+
     # Check if input rasters are aligned
-    assert core_raster.check_rasters_are_aligned(input_data), "Rasters are not aligned."
-
-    # Read input rasters as NumPy arrays and stack them
-    array = core_raster_io.raster_to_array(input_data, cast=dtype)
-
-    # Write the stacked array as a raster file
-    out_path = core_raster_io.array_to_raster(
-        array,
-        reference=input_data[0],
-        out_path=out_path,
-        overwrite=overwrite,
-        creation_options=creation_options,
-    )
+    metadata_list = core_raster._get_basic_metadata_raster_list(input_data)
+    assert core_raster._check_raster_metadata_are_aligned(metadata_list), "Rasters are not aligned."
+
+    metadata_ref = metadata_list[0]
+    x_size, y_size = metadata_ref["width"], metadata_ref["height"]
+    out_dtype = utils_translate._parse_dtype(metadata_ref["dtype"] if dtype is None else dtype)
+    out_dtype_gdal = utils_translate._translate_dtype_numpy_to_gdal(out_dtype)
+    total_bands = sum(metadata["bands"] for metadata in metadata_list)
+
+    # Unless a block size is requested, match the tiling of the first raster, so its blocks map one to one onto the output blocks.
+    creation_options = [] if creation_options is None else list(creation_options)
+    ref_block_x, ref_block_y = core_raster._raster_open(input_data[0]).GetRasterBand(1).GetBlockSize()
+    if (
+        not any(option.upper().startswith(("BLOCKXSIZE=", "BLOCKYSIZE=")) for option in creation_options)
+        and ref_block_x < x_size
+        and ref_block_x % 16 == 0
+        and ref_block_y % 16 == 0
+    ):
+        creation_options += [f"BLOCKXSIZE={ref_block_x}", f"BLOCKYSIZE={ref_block_y}"]
+
+    creation_options = utils_gdal._get_default_creation_options(creation_options, compression=compression, dtype=out_dtype)
+
+    # The output uses the nodata value of the first raster, as when the rasters are read as a masked array.
+    # Mixed values are found with a single set comparison, and warned about once. NaN != NaN, so it gets a stand-in.
+    nodata_values = {
+        "nan" if isinstance(value, float) and np.isnan(value) else value
+        for value in (metadata["nodata_value"] for metadata in metadata_list)
+    }
+    if len(nodata_values) > 1:
+        warnings.warn(
+            f"The rasters have different nodata values: {nodata_values}. "
+            f"The nodata value of the first raster is used for the stack: {metadata_ref['nodata_value']}"
+        )
+
+    out_nodata = None
+    if metadata_ref["nodata"]:
+        if utils_translate._check_is_value_within_dtype_range(metadata_ref["nodata_value"], out_dtype):
+            out_nodata = float(metadata_ref["nodata_value"])
+        else:
+            warnings.warn(
+                f"Nodata value {metadata_ref['nodata_value']} is outside of dtype {out_dtype} range. "
+                "The output will not have a nodata value."
+            )
+
+    utils_path._delete_if_required(out_path, overwrite)
+
+    if parallel:
+        return _raster_stack_list_parallel(input_data, metadata_list, out_path, out_dtype, out_nodata, creation_options, overwrite)
+
+    if method == "translate":
+        return _raster_stack_list_translate(input_data, metadata_list, out_path, out_dtype, out_nodata, creation_options)
+
+    driver = utils_gdal._get_default_driver_raster()
+    destination = driver.Create(out_path, x_size, y_size, total_bands, out_dtype_gdal, creation_options)
+
+    if destination is None:
+        raise RuntimeError(f"Could not create output raster: {out_path}")
+
+    destination.SetGeoTransform(metadata_ref["geotransform"])
+    destination.SetProjection(metadata_ref["projection_wkt"])
+
+    destination_bands = [destination.GetRasterBand(band_idx + 1) for band_idx in range(total_bands)]
+    for band in destination_bands:
+        band.SetColorInterpretation(gdal.GCI_Undefined)
+
+    if out_nodata is not None:
+        for band in destination_bands:
+            band.SetNoDataValue(out_nodata)
+
+    # Copy one source block window at a time, all bands of a source in one dataset level write. GDAL converts to the
+    # output dtype while decoding, clipping and rounding like the safe numpy casting does.
+    band_lists = []
+    bands_added = 0
+    for metadata in metadata_list:
+        band_lists.append(list(range(bands_added + 1, bands_added + metadata["bands"] + 1)))
+        bands_added += metadata["bands"]
+
+    if len(input_data) > 1 and x_size * y_size >= 1_000_000:
+        # Decode the sources concurrently, but write from this thread only, as a GTiff cannot be written from several threads.
+        blocks = queue.Queue(maxsize=4 * len(input_data))
+        cancel = threading.Event()
+
+        with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(input_data))) as executor:
+            futures = [
+                executor.submit(_raster_stack_read_blocks, raster, source_idx, out_dtype, blocks, cancel)
+                for source_idx, raster in enumerate(input_data)
+            ]
+
+            finished = 0
+            try:
+                while finished < len(futures):
+                    block = blocks.get()
+                    if block is None:
+                        finished += 1
+                        continue
+
+                    source_idx, x_offset, y_offset, data = block
+                    destination.WriteArray(data, x_offset, y_offset, band_list=band_lists[source_idx])
+
+            except BaseException:
+                # Let the readers stop and get out of a full queue
+                cancel.set()
+                while finished < len(futures):
+                    if blocks.get() is None:
+                        finished += 1
+                raise
+
+            for future in futures:
+                future.result()
+
+    else:
+        # The block buffer is reused, so memory is bounded by a single block window.
+        for raster, band_list in zip(input_data, band_lists):
+            for x_offset, y_offset, data in _raster_iterate_blocks(raster, out_dtype, reuse_buffer=True):
+                destination.WriteArray(data, x_offset, y_offset, band_list=band_list)
+
+    destination.FlushCache()
+    destination = None
 
     return out_path
 
 
+def _vrt_remove_scanline_block_sizes(vrt_path: str) -> None:
+    """Internal. Removes the block size from the source properties of a VRT when the source is read in scanlines.
+    VRTs declaring `BlockYSize="1"` make GDAL read the source one line at a time, which is very slow for windowed reads.
+    Without the attributes, GDAL takes the block size from the source itself.
+    """
+    vrt_file = gdal.VSIFOpenL(vrt_path, "rb")
+    if vrt_file is None:
+        return
+
+    try:
+        vrt_xml = gdal.VSIFReadL(1, gdal.VSIStatL(vrt_path).size, vrt_file).decode("utf-8")
+    finally:
+        gdal.VSIFCloseL(vrt_file)
+
+    fixed_xml = re.sub(r'\s+BlockXSize="\d+"\s+BlockYSize="1"', "", vrt_xml)
+
+    if fixed_xml == vrt_xml:
+        return
+
+    fixed_bytes = fixed_xml.encode("utf-8")
+    vrt_file = gdal.VSIFOpenL(vrt_path, "wb")
+
+    try:
+        gdal.VSIFWriteL(fixed_bytes, 1, len(fixed_bytes), vrt_file)
+    finally:
+        gdal.VSIFCloseL(vrt_file)
+
+
 def raster_stack_vrt_list(
     rasters: List[Union[str, gdal.Dataset]],
     out_path: Optional[str]=None,
@@ -270,6 +604,8 @@ def raster_stack_vrt_list(
     # Release the VRT object to avoid potential memory leaks
     vrt = None
 
+    _vrt_remove_scanline_block_sizes(out_path)
+
     return out_path
 
 
@@ -27,6 +27,7 @@ def _raster_set_datatype(
     *,
     overwrite: bool = True,
     creation_options: Optional[List[str]] = None,
+    copy_unchanged: bool = False,
 ) -> str:
     """Internal function.
 
@@ -55,6 +56,68 @@ def _raster_set_datatype(
     if isinstance(dtype_str, str):
         dtype_str = dtype_str.lower()
 
+    # Nothing to convert. Unless other creation options are requested, the files are copied as they are.
+    target_gdal_dtype = utils_translate._translate_dtype_numpy_to_gdal(dtype_str)
+    if (
+        copy_unchanged
+        and ref.GetDriver().ShortName == driver_name
+        and all(ref.GetRasterBand(band_idx + 1).DataType == target_gdal_dtype for band_idx in range(ref.RasterCount))
+    ):
+        try:
+            copied = driver.CopyFiles(out_path, ref.GetDescription()) == gdal.CE_None
+        except RuntimeError:
+            copied = False
+
+        if copied:
+            ref = None
+
+            return out_path
+
+        utils_path._delete_if_required(out_path, True)
+
+    # Let GDAL convert block by block, without reading the raster into memory.
+    try:
+        copy = gdal.Translate(
+            out_path,
+            ref,
+            format=driver_name,
+            outputType=target_gdal_dtype,
+            creationOptions=utils_gdal._get_default_creation_options(creation_options),
+        )
+    except RuntimeError:
+        copy = None
+
+    if copy is None:
+        utils_path._delete_if_required(out_path, True)
+        copy = _raster_set_datatype_copy_bands(ref, dtype_str, out_path, driver, metadata, creation_options)
+
+    # gdal.Translate clamps nodata values to the new datatype. Unset them instead, as the band copy does.
+    for band_idx in range(metadata["bands"]):
+        input_nodata = ref.GetRasterBand(band_idx + 1).GetNoDataValue()
+
+        if input_nodata is not None and not utils_translate._check_is_value_within_dtype_range(input_nodata, dtype_str):
+            warn("Input NoData value is outside the range of the output datatype. NoData value will not be set.", UserWarning)
+            copy.GetRasterBand(band_idx + 1).DeleteNoDataValue()
+
+    copy.FlushCache()
+
+    ref = None
+    copy = None
+
+    return out_path
+
+
+def _raster_set_datatype_copy_bands(
+    ref: gdal.Dataset,
+    dtype_str: Union[str, int, np.dtype],
+    out_path: str,
+    driver: gdal.Driver,
+    metadata: dict,
+    creation_options: Optional[List[str]] = None,
+) -> gdal.Dataset:
+    """Internal. Converts the datatype by copying the raster band by band with NumPy.
+    Used when gdal.Translate is unable to create the output.
+    """
     copy = driver.Create(
         out_path,
         metadata["width"],
@@ -74,28 +137,26 @@ def _raster_set_datatype(
         input_band = ref.GetRasterBand(band_idx + 1)
         output_band = copy.GetRasterBand(band_idx + 1)
 
-        # Read the input band data and write it to the output band
-        data = input_band.ReadAsArray(0, 0, input_band.XSize, input_band.YSize).astype(dtype_str)
-        output_band.WriteRaster(0, 0, input_band.XSize, input_band.YSize, data)
+        # Copy one block at a time, following the block layout of the input, so only a block is held in memory
+        block_x, block_y = input_band.GetBlockSize()
+        for y_offset in range(0, input_band.YSize, block_y):
+            y_size = min(block_y, input_band.YSize - y_offset)
 
-        # Set the NoData value for the output band if it exists in the input band
-        if input_band.GetNoDataValue() is not None:
-            input_nodata = input_band.GetNoDataValue()
-            if utils_translate._check_is_value_within_dtype_range(input_nodata, dtype_str):
-                output_band.SetNoDataValue(input_nodata)
-            else:
-                warn("Input NoData value is outside the range of the output datatype. NoData value will not be set.", UserWarning)
-                output_band.SetNoDataValue(None)
+            for x_offset in range(0, input_band.XSize, block_x):
+                x_size = min(block_x, input_band.XSize - x_offset)
 
-        # Set the color interpretation for the output band
-        output_band.SetColorInterpretation(input_band.GetColorInterpretation())
+                block = input_band.ReadAsArray(x_offset, y_offset, x_size, y_size)
+                output_band.WriteArray(block.astype(dtype_str, copy=False), x_offset, y_offset)
 
-    copy.FlushCache()
+        # Set the NoData value for the output band if it is within the range of the output datatype
+        input_nodata = input_band.GetNoDataValue()
+        if input_nodata is not None and utils_translate._check_is_value_within_dtype_range(input_nodata, dtype_str):
+            output_band.SetNoDataValue(input_nodata)
 
-    ref = None
-    copy = None
+        # Set the color interpretation for the output band
+        output_band.SetColorInterpretation(input_band.GetColorInterpretation())
 
-    return out_path
+    return copy
 
 
 def raster_set_datatype(
@@ -104,6 +165,7 @@ def raster_set_datatype(
     out_path: Optional[Union[str, List[str]]] = None,
     *,
     creation_options: Optional[List[str]] = None,
+    compression: Optional[str] = None,
     add_uuid: bool = False,
     add_timestamp: bool = False,
     prefix: str = "",
@@ -127,6 +189,10 @@ def raster_set_datatype(
         A list of GDAL creation options for the output raster(s). Default is
         ["TILED=YES", "NUM_THREADS=ALL_CPUS", "BIGTIFF=YES", "COMPRESS=LZW"].
 
+    compression : str, optional
+        The compression to use when none is set in the creation options. One of "lzw", "deflate",
+        "zstd", "lerc_zstd" or "none". A PREDICTOR matching the datatype is added. If None, LZW is used. Default: None.
+
     add_uuid : bool, optional
         Determines whether to add a UUID to the output path. Default: False.
 
@@ -151,6 +217,7 @@ def raster_set_datatype(
     utils_base._type_check(dtype, [str, np.dtype, int, type(np.int8)], "dtype")
     utils_base._type_check(out_path, [list, str, None], "out_path")
     utils_base._type_check(creation_options, [list, None], "creation_options")
+    utils_base._type_check(compression, [str, None], "compression")
     utils_base._type_check(add_uuid, [bool], "add_uuid")
     utils_base._type_check(add_timestamp, [bool], "add_timestamp")
     utils_base._type_check(prefix, [str], "prefix")
@@ -169,21 +236,24 @@ def raster_set_datatype(
         suffix=suffix,
     )
 
-    creation_options = utils_gdal._get_default_creation_options(creation_options)
+    # Rasters already of the datatype are copied as they are, unless the output layout is asked for explicitly
+    copy_unchanged = creation_options is None and compression is None
+    creation_options = utils_gdal._get_default_creation_options(creation_options, compression=compression, dtype=dtype)
 
     utils_path._delete_if_required_list(out_paths, overwrite)
 
-    output = []
-    for idx, in_raster in enumerate(input_rasters):
-        path = _raster_set_datatype(
+    # The rasters are independent, so they are converted concurrently
+    output = utils_gdal._run_in_threads(
+        lambda in_raster, out_raster: _raster_set_datatype(
             in_raster,
             dtype,
-            out_path=out_paths[idx],
+            out_path=out_raster,
             overwrite=overwrite,
             creation_options=creation_options,
-        )
-
-        output.append(path)
+            copy_unchanged=copy_unchanged,
+        ),
+        list(zip(input_rasters, out_paths)),
+    )
 
     if input_is_list:
         return output
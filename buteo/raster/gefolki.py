@@ -323,7 +323,7 @@ def interpolate(image, xslice, yslice, mapLU, mapRU, mapLB, mapRB, aLUT):
 
     # interpolation weight matrices
     x_coef, y_coef = np.meshgrid(np.arange(xslice.size),
-                                 np.arange(yslice.size))
+                                 np.arange(yslice.size), sparse=True)
     x_inv_coef, y_inv_coef = x_coef[:, ::-1] + 1, y_coef[::-1] + 1
 
     view = image[int(yslice[0]):int(yslice[-1] + 1),
@@ -374,7 +374,8 @@ def EFolkiIter(I0, I1, iteration=5, radius=[8, 4], rank=4, uinit=None,vinit=None
     Iy, Ix = np.gradient(I0)
 
     cols, rows = I0.shape[1], I0.shape[0]
-    x, y = np.meshgrid(range(cols), range(rows))
+    # Row and column vectors broadcast against the flow fields, so the full grids are never stored.
+    x, y = np.meshgrid(np.arange(cols), np.arange(rows), sparse=True)
 
     for rad in radius:
 
@@ -491,7 +492,8 @@ def GEFolkiIter(I0, I1, iteration=5, radius=[8, 4], rank=4, uinit=None, vinit=No
     Iy, Ix = np.gradient(R0)
 
     cols, rows = I0.shape[1], I0.shape[0]
-    x, y = np.meshgrid(range(cols), range(rows))
+    # Row and column vectors broadcast against the flow fields, so the full grids are never stored.
+    x, y = np.meshgrid(np.arange(cols), np.arange(rows), sparse=True)
     for rad in radius:
 
         burt1D = np.array(np.ones([1, 2*rad+1]))/(2*rad + 1)
@@ -670,7 +672,7 @@ def rank_filter_inf(I, rad):
 def wrapData(I, u, v):
     """Apply the [u,v] optical flow to the data I"""
     col, row = I.shape[1], I.shape[0]
-    X, Y = np.meshgrid(range(col), range(row))
+    X, Y = np.meshgrid(np.arange(col), np.arange(row), sparse=True)
     R = interp2(I, X+u, Y+v)
 
     return R
@@ -8,13 +8,14 @@ Cut rasters to grids. Use vectors or rasters as grids.
 # Standard library
 import sys; sys.path.append("../../")
 from uuid import uuid4
+from threading import Lock
 from typing import Union, Optional, List
 
 # External
 from osgeo import gdal, ogr
 
 # Internal
-from buteo.utils import utils_base, utils_gdal, utils_bbox, utils_path
+from buteo.utils import utils_base, utils_gdal, utils_path, utils_aux
 from buteo.raster import core_raster, core_stack
 from buteo.raster.clip import _raster_clip
 from buteo.vector import core_vector
@@ -98,7 +99,6 @@ def raster_to_grid(
     use_grid = core_vector.vector_open(use_grid)
 
     layer = use_grid.GetLayer(process_layer)
-    feature_count = layer.GetFeatureCount()
     raster_extent = raster_metadata["bbox"]
     filetype = utils_path._get_ext_from_path(raster)
     name = raster_metadata["name"]
@@ -111,26 +111,22 @@ def raster_to_grid(
                 f"Requested field not found. Fields available are: {names}"
             )
 
-    generated = []
-
     # For the sake of good reporting - lets first establish how many features intersect
     # the raster.
 
     if verbose:
         print("Finding intersections.")
 
-    intersections = 0
-    for _ in range(feature_count):
-        feature = layer.GetNextFeature()
-        geom = feature.GetGeometryRef()
-
-        if not utils_bbox._check_bboxes_intersect(raster_extent, geom.GetEnvelope()):
-            continue
-
-        intersections += 1
-
+    # Let OGR select the cells that meet the raster extent. It uses the layer's own spatial index where there
+    # is one, so cells far from the raster are never read.
+    x_min, x_max, y_min, y_max = raster_extent
+    layer.SetSpatialFilterRect(x_min, y_min, x_max, y_max)
+    intersecting_fids = [feature.GetFID() for feature in layer]
+    layer.SetSpatialFilter(None)
     layer.ResetReading()
 
+    intersections = len(intersecting_fids)
+
     if verbose:
         print(f"Found {intersections} intersections.")
 
@@ -140,29 +136,24 @@ def raster_to_grid(
 
     driver = ogr.GetDriverByName("GPKG")
 
-    clipped = 0
-    for _ in range(feature_count):
-
-        feature = layer.GetNextFeature()
-        geom = feature.GetGeometryRef()
-
-        if not utils_bbox._check_bboxes_intersect(raster_extent, geom.GetEnvelope()):
-            continue
-
-        if verbose == 1:
-            utils_base.progress(clipped, intersections - 1, "clip_grid")
-
-        fid = feature.GetFID()
+    # The cells are written to their own vectors first, as OGR layers cannot be read from several threads.
+    jobs = []
+    for fid in intersecting_fids:
+        feature = layer.GetFeature(fid)
 
         test_ds_path = f"/vsimem/grid_{uuid4().int}.gpkg"
         test_ds = driver.CreateDataSource(test_ds_path)
+        # A single cell does not need an R-tree, and maintaining one costs a trigger on every insert.
         test_ds_lyr = test_ds.CreateLayer(
             "mem_layer_grid",
             geom_type=geom_type,
             srs=raster_metadata["projection_osr"],
+            options=["SPATIAL_INDEX=NO"],
         )
         test_ds_lyr.CreateFeature(feature.Clone())
         test_ds.FlushCache()
+        test_ds_lyr = None
+        test_ds = None
 
         out_name = None
 
@@ -171,21 +162,49 @@ def raster_to_grid(
         else:
             out_name = f"{out_dir}{name}_{fid}{filetype}"
 
-        _raster_clip(
-            ref,
-            test_ds_path,
+        jobs.append((test_ds_path, out_name))
+
+    if verbose:
+        print(f"Clipping {len(jobs)} cells.")
+
+    creation_options = utils_gdal._get_default_creation_options(creation_options)
+
+    # The cells are independent, so they are clipped concurrently, with every thread opening the raster from its path.
+    # Datasets without a backing file (e.g. MEM) cannot be reopened, so they are clipped one by one from the open dataset.
+    raster_path = utils_gdal._get_path_from_dataset(ref)
+    threaded = utils_path._check_file_exists(raster_path)
+
+    clipped = [0]
+    clipped_lock = Lock()
+
+    def _clip_cell(source, cell_path, out_name):
+        out_path = _raster_clip(
+            source,
+            cell_path,
             out_path=out_name,
             adjust_bbox=True,
             crop_to_geom=True,
             all_touch=False,
             suffix="",
             prefix="",
-            creation_options=utils_gdal._get_default_creation_options(creation_options),
+            creation_options=creation_options,
             verbose=0,
         )
 
-        generated.append(out_name)
-        clipped += 1
+        if verbose == 1:
+            with clipped_lock:
+                clipped[0] += 1
+                utils_aux._print_progress(clipped[0], len(jobs), "clip_grid")
+
+        return out_path
+
+    if threaded:
+        generated = utils_gdal._run_in_threads(_clip_cell, [(raster_path, cell_path, out_name) for cell_path, out_name in jobs])
+    else:
+        generated = [_clip_cell(ref, cell_path, out_name) for cell_path, out_name in jobs]
+
+    for cell_path, _ in jobs:
+        gdal.Unlink(cell_path)
 
     if generate_vrt:
         vrt_name = f"{out_dir}{name}.vrt"
@@ -11,14 +11,14 @@ from buteo.utils import (
     utils_io,
     utils_base,
 )
-from buteo.raster.core_raster import _get_basic_metadata_raster
+from buteo.raster.core_raster import _get_basic_metadata_raster, _type_check_raster
 
 
 def _raster_to_metadata(
     raster: Union[str, gdal.Dataset],
 ) -> dict:
     """Internal."""
-    utils_base._type_check(raster, [str, gdal.Dataset], "raster")
+    _type_check_raster(raster)
 
     metadata = _get_basic_metadata_raster(raster)
 
@@ -42,12 +42,7 @@ def _raster_has_nodata(
     """
     assert isinstance(raster, (str, gdal.Dataset)), f"Invalid raster. {raster}"
 
-    metadata = core_raster._get_basic_metadata_raster(raster)
-
-    if metadata["nodata"]:
-        return True
-
-    return False
+    return core_raster._get_first_nodata_value(raster) is not None
 
 
 def raster_has_nodata(
@@ -98,9 +93,7 @@ def _raster_get_nodata(
     """
     utils_base._type_check(raster, [str, gdal.Dataset], "raster")
 
-    metadata = core_raster._get_basic_metadata_raster(raster)
-
-    return metadata["nodata_value"]
+    return core_raster._get_first_nodata_value(raster)
 
 
 def raster_get_nodata(
@@ -243,6 +243,9 @@ def raster_reproject(
 
     utils_path._delete_if_required_list(out_path_list, overwrite)
 
+    # Resolve the creation options once for the whole batch
+    creation_options = utils_gdal._get_default_creation_options(creation_options)
+
     output = []
     for index, in_raster in enumerate(raster_list):
         output.append(
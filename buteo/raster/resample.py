@@ -6,6 +6,7 @@ Can uses references from vector or other raster datasets.
 
 # Standard library
 import sys; sys.path.append("../../")
+import os
 from typing import Union, Optional, List
 
 # External
@@ -33,6 +34,7 @@ def _raster_resample(
     resample_alg: str = "nearest",
     overwrite: bool = True,
     creation_options: Optional[List[str]] = None,
+    compression: Optional[str] = None,
     dtype: Optional[str] = None,
     dst_nodata: Union[float, int, str] = "infer",
     verbose: int = 0,
@@ -49,8 +51,7 @@ def _raster_resample(
         if not utils_path._check_is_valid_output_filepath(out_path):
             raise ValueError(f"Invalid output path: {out_path}")
 
-    ref = core_raster._raster_open(raster)
-    metadata = core_raster._get_basic_metadata_raster(ref)
+    metadata = core_raster._get_basic_metadata_raster(raster)
 
     if isinstance(target_size, (gdal.Dataset, str)):
         x_res, y_res = utils_gdal._get_raster_size(target_size)
@@ -99,11 +100,20 @@ def _raster_resample(
     if out_nodata is not None and not utils_translate._check_is_value_within_dtype_range(out_nodata, dtype):
         raise ValueError(f"Invalid nodata value for datatype. value: {out_nodata}, dtype: {dtype}")
 
+    creation_options = utils_gdal._get_default_creation_options(creation_options, compression=compression, dtype=dtype)
+
     utils_path._delete_if_required(out_path, overwrite)
 
     if verbose == 0:
         gdal.PushErrorHandler("CPLQuietErrorHandler")
 
+    # Spread the warping itself over the cores as well, not just the I/O. Warping in chunks aligned to whole output
+    # blocks means every compressed block is encoded once, instead of being read back and rewritten for each chunk.
+    warp_options = [
+        f"NUM_THREADS={gdal.GetConfigOption('GDAL_NUM_THREADS', 'ALL_CPUS')}",
+        "OPTIMIZE_SIZE=TRUE",
+    ]
+
     if x_pixels is None or y_pixels is None:
         options = gdal.WarpOptions(
             format=out_format,
@@ -111,10 +121,11 @@ def _raster_resample(
             yRes=y_res,
             outputType=utils_translate._translate_dtype_numpy_to_gdal(dtype),
             resampleAlg=utils_translate._translate_resample_method(resample_alg),
-            creationOptions=utils_gdal._get_default_creation_options(creation_options),
+            creationOptions=creation_options,
             srcNodata=metadata["nodata_value"],
             dstNodata=out_nodata,
             multithread=True,
+            warpOptions=warp_options,
             warpMemoryLimit=utils_gdal._get_dynamic_memory_limit(ram, min_mb=ram_min, max_mb=ram_max),
         )
     else:
@@ -124,14 +135,18 @@ def _raster_resample(
             height=y_pixels,
             outputType=utils_translate._translate_dtype_numpy_to_gdal(dtype),
             resampleAlg=utils_translate._translate_resample_method(resample_alg),
-            creationOptions=utils_gdal._get_default_creation_options(creation_options),
+            creationOptions=creation_options,
             srcNodata=metadata["nodata_value"],
             dstNodata=out_nodata,
             multithread=True,
+            warpOptions=warp_options,
             warpMemoryLimit=utils_gdal._get_dynamic_memory_limit(ram, min_mb=ram_min, max_mb=ram_max),
         )
 
+    # Open the source once, right before warping, and release both handles as soon as the warp is done.
+    ref = core_raster._raster_open(raster)
     resampled = gdal.Warp(out_path, ref, options=options)
+    ref = None
 
     if verbose == 0:
         gdal.PopErrorHandler()
@@ -139,6 +154,9 @@ def _raster_resample(
     if resampled is None:
         raise RuntimeError(f"Error while resampling raster: {out_path}")
 
+    resampled.FlushCache()
+    resampled = None
+
     return out_path
 
 
@@ -150,6 +168,7 @@ def raster_resample(
     target_in_pixels=False,
     resample_alg="nearest",
     creation_options=None,
+    compression=None,
     dtype=None,
     dst_nodata="infer",
     prefix="",
@@ -186,6 +205,10 @@ def raster_resample(
     creation_options : list, optional
         A list of creation options for the output raster(s), default: None
 
+    compression : str, optional
+        The compression to use when none is set in the creation options. One of "lzw", "deflate",
+        "zstd", "lerc_zstd" or "none". A PREDICTOR matching the datatype is added. If None, LZW is used, default: None
+
     dtype : str, optional
         The output data type, default: None
 
@@ -231,6 +254,7 @@ def raster_resample(
     utils_base._type_check(resample_alg, [str], "resample_alg")
     utils_base._type_check(overwrite, [bool], "overwrite")
     utils_base._type_check(creation_options, [[str], None], "creation_options")
+    utils_base._type_check(compression, [str, None], "compression")
     utils_base._type_check(dst_nodata, [str, int, float, None], "dst_nodata")
     utils_base._type_check(dtype, [str, None, np.dtype, type(np.int8)], "dtype")
     utils_base._type_check(prefix, [str], "prefix")
@@ -257,24 +281,39 @@ def raster_resample(
 
     utils_path._delete_if_required_list(output_rasters, overwrite)
 
-    resampled_rasters = []
-    for idx, in_raster in enumerate(input_rasters):
-        resampled_rasters.append(
-            _raster_resample(
-                in_raster,
-                target_size,
-                target_in_pixels=target_in_pixels,
-                out_path=output_rasters[idx],
-                resample_alg=resample_alg,
-                overwrite=overwrite,
-                creation_options=creation_options,
-                dtype=dtype,
-                dst_nodata=dst_nodata,
-                ram=ram,
-                ram_max=ram_max,
-                ram_min=ram_min,
-            )
-        )
+    # A reference raster only gives the target resolution, so it is opened once for the batch, not once per raster.
+    if isinstance(target_size, (gdal.Dataset, str)):
+        target_size = list(utils_gdal._get_raster_size(target_size))
+        target_in_pixels = False
+
+    # Resolve the creation options once for the whole batch. With a compression but no target datatype, the predictor
+    # follows the datatype of each raster, so those are resolved per raster.
+    if compression is None or dtype is not None:
+        creation_options = utils_gdal._get_default_creation_options(creation_options, compression=compression, dtype=dtype)
+
+    # The rasters are independent, so they are resampled concurrently. The warps share the memory budget.
+    workers = min(len(input_rasters), os.cpu_count() or 1)
+    ram = ram / workers
+    ram_max = None if ram_max is None else ram_max / workers
+
+    resampled_rasters = utils_gdal._run_in_threads(
+        lambda in_raster, out_raster: _raster_resample(
+            in_raster,
+            target_size,
+            target_in_pixels=target_in_pixels,
+            out_path=out_raster,
+            resample_alg=resample_alg,
+            overwrite=overwrite,
+            creation_options=creation_options,
+            compression=compression,
+            dtype=dtype,
+            dst_nodata=dst_nodata,
+            ram=ram,
+            ram_max=ram_max,
+            ram_min=ram_min,
+        ),
+        list(zip(input_rasters, output_rasters)),
+    )
 
     if input_is_list:
         return resampled_rasters
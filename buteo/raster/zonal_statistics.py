@@ -9,7 +9,7 @@ from typing import Union, List, Optional
 # External
 import numpy as np
 from osgeo import gdal, ogr
-from numba import prange, jit
+from numba import prange
 
 # Internal
 from buteo.utils import (
@@ -21,7 +21,7 @@ from buteo.raster.core_raster import _get_basic_metadata_raster
 from buteo.vector.core_vector import _get_basic_metadata_vector, vector_create_attribute_from_fid
 from buteo.vector.rasterize import vector_rasterize
 from buteo.raster.align import _raster_align_to_reference
-from buteo.raster.core_raster_io import raster_to_array, array_to_raster
+from buteo.raster.core_raster_io import raster_to_array
 from buteo.raster.clip import raster_clip
 
 
@@ -36,28 +36,27 @@ def _calculate_zonal_statistics(
     # statistics
     stats = np.zeros((len(zones), len(statistics)), dtype=np.float32)
 
-    # import pdb; pdb.set_trace()
-
     # calculate statistics
     for zone_idx in prange(len(zones)):
         zone = zones[zone_idx]
         if zone == 0:
             continue
 
-        mask = vector_arr == zone
+        # Gather the zone's values once, instead of once per statistic
+        values = raster_arr[vector_arr == zone]
         for stat_idx, stat in enumerate(statistics):
             if stat == "mean":
-                stats[zone_idx][stat_idx] = np.mean(raster_arr[mask])
+                stats[zone_idx][stat_idx] = np.mean(values)
             elif stat == "median":
-                stats[zone_idx][stat_idx] = np.median(raster_arr[mask])
+                stats[zone_idx][stat_idx] = np.median(values)
             elif stat == "std":
-                stats[zone_idx][stat_idx] = np.std(raster_arr[mask])
+                stats[zone_idx][stat_idx] = np.std(values)
             elif stat == "min":
-                stats[zone_idx][stat_idx] = np.min(raster_arr[mask])
+                stats[zone_idx][stat_idx] = np.min(values)
             elif stat == "max":
-                stats[zone_idx][stat_idx] = np.max(raster_arr[mask])
+                stats[zone_idx][stat_idx] = np.max(values)
             elif stat == "sum":
-                stats[zone_idx][stat_idx] = np.sum(raster_arr[mask])
+                stats[zone_idx][stat_idx] = np.sum(values)
 
     return stats
 
@@ -88,12 +87,10 @@ def _raster_get_zonal_statistics(
     raster_clipped_metadata = _get_basic_metadata_raster(raster_clipped)
 
     vector_updated = vector_create_attribute_from_fid(vector, "_zonal_id")
-    import pdb; pdb.set_trace()
-
 
     # rasterize vector
     rasterized_vector = vector_rasterize(
-        vector,
+        vector_updated,
         pixel_size=raster_clipped_metadata["pixel_size"],
         projection=raster_clipped_metadata["projection_osr"],
         extent=raster_clipped,
@@ -16,6 +16,7 @@ The GDAL geotransform is a list of six parameters:</br>
 import sys; sys.path.append("../../")
 from typing import List, Union, Dict, Any, Optional
 from uuid import uuid4
+import struct
 
 # External
 import numpy as np
@@ -391,6 +392,22 @@ def _get_sub_geotransform(
     }
 
 
+# Little endian, wkbPolygon25D, one ring of five points.
+_WKB_POLYGON_25D_RING_5_HEADER = struct.pack("<BIII", 1, 0x80000003, 1, 5)
+
+
+def _get_polygon_from_corners(
+    corners: List[List[Union[int, float]]],
+) -> ogr.Geometry:
+    """Internal. Builds a polygon from its four corners with a single WKB parse, instead of adding the points one by one.
+    The polygon matches one built with `AddPoint`, which gives every point a z of 0."""
+    coords = np.zeros((5, 3), dtype="<f8")
+    coords[:4, :2] = corners
+    coords[4] = coords[0]
+
+    return ogr.CreateGeometryFromWkb(_WKB_POLYGON_25D_RING_5_HEADER + coords.tobytes())
+
+
 def _get_geom_from_bbox(
     bbox_ogr: List[Union[int, float]],
 ) -> ogr.Geometry:
@@ -414,16 +431,12 @@ def _get_geom_from_bbox(
 
     x_min, x_max, y_min, y_max = bbox_ogr
 
-    ring = ogr.Geometry(ogr.wkbLinearRing)
-
-    ring.AddPoint(x_min, y_min)
-    ring.AddPoint(x_max, y_min)
-    ring.AddPoint(x_max, y_max)
-    ring.AddPoint(x_min, y_max)
-    ring.AddPoint(x_min, y_min)
-
-    geom = ogr.Geometry(ogr.wkbPolygon)
-    geom.AddGeometry(ring)
+    geom = _get_polygon_from_corners([
+        [x_min, y_min],
+        [x_max, y_min],
+        [x_max, y_max],
+        [x_min, y_max],
+    ])
 
     return geom
 
@@ -946,15 +959,12 @@ def _get_bounds_from_bbox(
 
     gdal.PopErrorHandler()
 
-    ring = ogr.Geometry(ogr.wkbLinearRing)
-    ring.AddPoint(p1t[1], p1t[0])
-    ring.AddPoint(p2t[1], p2t[0])
-    ring.AddPoint(p3t[1], p3t[0])
-    ring.AddPoint(p4t[1], p4t[0])
-    ring.AddPoint(p1t[1], p1t[0])
-
-    polygon = ogr.Geometry(ogr.wkbPolygon)
-    polygon.AddGeometry(ring)
+    polygon = _get_polygon_from_corners([
+        [p1t[1], p1t[0]],
+        [p2t[1], p2t[0]],
+        [p3t[1], p3t[0]],
+        [p4t[1], p4t[0]],
+    ])
 
     if wkt:
         return polygon.ExportToWkt()
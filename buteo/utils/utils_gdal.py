@@ -5,7 +5,8 @@ These functions are used to interact with basic GDAL objects.
 
 # Standard Library
 import sys; sys.path.append("../../")
-from typing import Optional, Union, List, Any, Tuple
+from typing import Optional, Union, List, Any, Tuple, Callable
+from concurrent.futures import ThreadPoolExecutor
 from warnings import warn
 import os
 
@@ -19,8 +20,20 @@ from buteo.utils import utils_path, utils_translate
 
 
 
+_COMPRESSION_OPTIONS = {
+    "lzw": ["COMPRESS=LZW"],
+    "deflate": ["COMPRESS=DEFLATE"],
+    "zstd": ["COMPRESS=ZSTD", "ZSTD_LEVEL=1"],
+    "lerc_zstd": ["COMPRESS=LERC_ZSTD"],
+    "none": ["COMPRESS=NONE"],
+}
+
+
 def _get_default_creation_options(
     options: Optional[List] = None,
+    *,
+    compression: Optional[str] = None,
+    dtype: Optional[Union[str, np.dtype, int]] = None,
 ) -> List:
     """Takes a list of GDAL creation options and adds the following defaults to it if their not specified: </br>
 
@@ -41,12 +54,25 @@ def _get_default_creation_options(
     options : Optional[list], optional
         A list of GDAL creation options, default: None
 
+    compression : Optional[str], optional
+        The compression to use if none is set in the options. One of "lzw", "deflate", "zstd",
+        "lerc_zstd" or "none". "zstd" reads faster and compresses better than LZW, especially for
+        float data. "lerc_zstd" is lossless unless a MAX_Z_ERROR is given in the options, which
+        suits elevation data. If None, LZW is used. Default: None
+
+    dtype : Optional[Union[str, np.dtype, int]], optional
+        The datatype of the raster. When a compression is chosen, it is used to add a matching
+        PREDICTOR: 3 for floats and 2 for integers. Default: None
+
     Returns
     -------
     list
         A list of GDAL creation options with the defaults added.
     """
     assert isinstance(options, (list, type(None))), "Options must be a list or None."
+    assert compression is None or compression.lower() in _COMPRESSION_OPTIONS, (
+        f"compression must be one of {list(_COMPRESSION_OPTIONS)} or None."
+    )
 
     if options is None:
         options = []
@@ -64,7 +90,13 @@ def _get_default_creation_options(
         internal_options.append("BIGTIFF=IF_SAFER")
 
     if "COMPRESS" not in opt_str:
-        internal_options.append("COMPRESS=LZW")
+        if compression is None:
+            internal_options.append("COMPRESS=LZW")
+        else:
+            internal_options += _COMPRESSION_OPTIONS[compression.lower()]
+
+            if dtype is not None:
+                internal_options = _add_predictor_creation_option(internal_options, dtype)
 
     if "BLOCKXSIZE" not in opt_str:
         internal_options.append("BLOCKXSIZE=256")
@@ -75,6 +107,45 @@ def _get_default_creation_options(
     return internal_options
 
 
+def _add_predictor_creation_option(
+    options: List[str],
+    dtype: Union[str, np.dtype, int],
+) -> List[str]:
+    """Adds a PREDICTOR matching the datatype to a list of GDAL creation options, if none is set and
+    the compression is LZW, DEFLATE or ZSTD: 3 (floating point) for floats and 2 (horizontal differencing) for integers.
+    Predictors make continuous data compress much better and decompress faster.
+
+    Parameters
+    ----------
+    options : list
+        A list of GDAL creation options.
+
+    dtype : Union[str, np.dtype, int]
+        The datatype of the raster.
+
+    Returns
+    -------
+    list
+        The creation options with the predictor added.
+    """
+    assert isinstance(options, list), "Options must be a list."
+
+    options = list(options)
+    opt_str = " ".join(options).upper()
+
+    if "PREDICTOR" in opt_str or not any(f"COMPRESS={name}" in opt_str for name in ["LZW", "DEFLATE", "ZSTD"]):
+        return options
+
+    dtype = utils_translate._parse_dtype(dtype)
+
+    if dtype.kind == "f":
+        options.append("PREDICTOR=3")
+    elif dtype.kind in ["i", "u"]:
+        options.append("PREDICTOR=2")
+
+    return options
+
+
 def get_gdal_memory() -> List:
     """Get at list of all active memory layers in GDAL.
 
@@ -134,6 +205,114 @@ def clear_gdal_memory() -> None:
         warn("Failed to clear all GDAL memory.", RuntimeWarning)
 
 
+def configure_gdal(
+    cache_mb: Optional[int] = None,
+    *,
+    num_threads: Optional[str] = None,
+    vsi_cache: bool = True,
+    disable_readdir_on_open: bool = False,
+    overwrite: bool = False,
+) -> None:
+    """Configures the GDAL block cache and the config options used when reading rasters.
+    Called once when buteo is imported. Options already set by the user are kept unless overwrite is True,
+    and the block cache is only ever raised, never shrunk below the current GDAL setting.
+
+    Parameters
+    ----------
+    cache_mb : int, optional
+        The minimum size of the GDAL block cache in megabytes. If None, the `BUTEO_GDAL_CACHEMAX`
+        environment variable is used, falling back to 512. Default: None.
+
+    num_threads : str, optional
+        The value for `GDAL_NUM_THREADS`, e.g. "ALL_CPUS". If None, it is not set. Default: None.
+
+    vsi_cache : bool, optional
+        If True, `VSI_CACHE` is enabled. Default: True.
+
+    disable_readdir_on_open : bool, optional
+        If True, `GDAL_DISABLE_READDIR_ON_OPEN` is set to `EMPTY_DIR`. This makes opening files in
+        large or remote folders faster, but sidecar files (.aux.xml, .ovr, .hdr, world files) are
+        no longer found. Default: False.
+
+    overwrite : bool, optional
+        If True, options already set in the environment are overwritten. Default: False.
+
+    Returns
+    -------
+    None
+    """
+    assert isinstance(cache_mb, (int, type(None))), "cache_mb must be an integer or None."
+    assert isinstance(num_threads, (str, type(None))), "num_threads must be a string or None."
+    assert isinstance(vsi_cache, bool), "vsi_cache must be a boolean."
+    assert isinstance(disable_readdir_on_open, bool), "disable_readdir_on_open must be a boolean."
+    assert isinstance(overwrite, bool), "overwrite must be a boolean."
+
+    def _set_option(key: str, value: str) -> None:
+        if overwrite or gdal.GetConfigOption(key) is None:
+            gdal.SetConfigOption(key, value)
+
+    if cache_mb is None:
+        cache_mb = int(os.environ.get("BUTEO_GDAL_CACHEMAX", 512))
+
+    if overwrite or gdal.GetConfigOption("GDAL_CACHEMAX") is None:
+        gdal.SetCacheMax(max(gdal.GetCacheMax(), cache_mb * 1024 * 1024))
+
+    if num_threads is not None:
+        _set_option("GDAL_NUM_THREADS", num_threads)
+
+    if vsi_cache:
+        _set_option("VSI_CACHE", "TRUE")
+
+    if disable_readdir_on_open:
+        _set_option("GDAL_DISABLE_READDIR_ON_OPEN", "EMPTY_DIR")
+
+
+def _run_in_threads(
+    func: Callable,
+    jobs: List[Tuple],
+    max_workers: Optional[int] = None,
+) -> List[Any]:
+    """Runs `func(*job)` for every job in a thread pool and returns the results in the order of the jobs.
+    GDAL releases the GIL while it decodes, warps and encodes, so independent rasters are processed
+    concurrently. Each job must open its own datasets, as they cannot be shared between threads.
+    GDAL's own threading is limited to one thread per job, so the cores are not oversubscribed.
+
+    Parameters
+    ----------
+    func : Callable
+        The function to run.
+
+    jobs : list
+        A list of argument tuples, one per call.
+
+    max_workers : int, optional
+        The maximum number of threads. If None, the number of CPUs is used. Default: None.
+
+    Returns
+    -------
+    list
+        The return values of the calls.
+    """
+    assert callable(func), "func must be callable."
+    assert isinstance(jobs, list), "jobs must be a list."
+
+    if len(jobs) <= 1:
+        return [func(*job) for job in jobs]
+
+    def _run_job(job):
+        gdal.SetThreadLocalConfigOption("GDAL_NUM_THREADS", "1")
+        try:
+            return func(*job)
+        finally:
+            gdal.SetThreadLocalConfigOption("GDAL_NUM_THREADS", None)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        return list(executor.map(_run_job, jobs))
+
+
 def _check_is_valid_ext(ext: str) -> bool:
     """Check if a file extension has a valid GDAL or OGR driver.
 
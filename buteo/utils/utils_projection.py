@@ -5,7 +5,6 @@ import sys; sys.path.append("../../")
 from typing import Union, List
 
 # External
-import osgeo
 from osgeo import gdal, ogr, osr
 import numpy as np
 import math
@@ -3,7 +3,7 @@
 Functions to translate between **GDAL** and **NumPy** datatypes.
 """
 # Standard Library
-from typing import List, Tuple, Union, Dict, Type, Optional
+from typing import List, Tuple, Union, Dict, Type
 
 # External
 import numpy as np
@@ -81,6 +81,9 @@ def _vector_buffer(
 
         feature_count = vector_layer_origin.GetFeatureCount()
 
+        # Write all the features in one transaction, instead of one per feature.
+        vector_layer_destination.StartTransaction()
+
         vector_layer_origin.ResetReading()
         for _ in range(feature_count):
             feature = vector_layer_origin.GetNextFeature()
@@ -120,6 +123,8 @@ def _vector_buffer(
                 
                 vector_layer_destination.CreateFeature(out_feature)
 
+        vector_layer_destination.CommitTransaction()
+
         vector_layer_destination.GetExtent()
         vector_layer_destination.ResetReading()
         vector_layer_destination.SyncToDisk()
@@ -316,6 +316,8 @@ def _vector_filter(
         layer_original = datasource_original.GetLayer(i)
         layer_destination = datasource_destination.CreateLayer(layer_original.GetName(), projection, geom_type)
 
+        layer_destination.StartTransaction()
+
         for feature in range(features):
             feature = layer_original.GetNextFeature()
 
@@ -330,6 +332,7 @@ def _vector_filter(
             if filter_function(field_dict):
                 layer_destination.CreateFeature(feature.Clone())
 
+        layer_destination.CommitTransaction()
         layer_destination.SyncToDisk()
         layer_destination.ResetReading()
         layer_destination = None
@@ -1099,13 +1102,13 @@ def vector_from_wkt(
 
     datasource = driver.CreateDataSource(out_path)
 
-    geom_type = ogr.CreateGeometryFromWkt(wkt).GetGeometryType()
+    geom = ogr.CreateGeometryFromWkt(wkt)
 
-    layer = datasource.CreateLayer("temp_geom", geom_type=geom_type, srs=proj)
+    layer = datasource.CreateLayer("temp_geom", geom_type=geom.GetGeometryType(), srs=proj)
     layer_defn = layer.GetLayerDefn()
 
     feature = ogr.Feature(layer_defn)
-    feature.SetGeometry(ogr.CreateGeometryFromWkt(wkt))
+    feature.SetGeometryDirectly(geom)
 
     layer.CreateFeature(feature)
     layer.SyncToDisk()
@@ -1161,18 +1164,24 @@ def vector_from_points(
     layer = datasource.CreateLayer("points", geom_type=ogr.wkbPoint, srs=proj)
     layer_defn = layer.GetLayerDefn()
 
+    # One point geometry is reused for all the features, as SetGeometry stores a copy.
+    geom = ogr.Geometry(ogr.wkbPoint)
+
+    layer.StartTransaction()
+
     for point in points:
         feature = ogr.Feature(layer_defn)
-        geom = ogr.Geometry(ogr.wkbPoint)
         if reverse_xy_order:
-            geom.AddPoint(point[1], point[0])
+            geom.SetPoint(0, point[1], point[0])
         else:
-            geom.AddPoint(point[0], point[1])
+            geom.SetPoint(0, point[0], point[1])
         feature.SetGeometry(geom)
         
         layer.CreateFeature(feature)
         feature = None
 
+    layer.CommitTransaction()
+
     layer.GetExtent()
     layer.SyncToDisk()
 
@@ -8,11 +8,9 @@ from osgeo import ogr, gdal, osr
 
 # Internal
 from buteo.utils import (
-    utils_io,
     utils_base,
     utils_gdal,
     utils_bbox,
-    utils_path,
 )
 from buteo.vector.core_vector import _vector_open
 
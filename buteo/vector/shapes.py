@@ -8,11 +8,8 @@ from osgeo import ogr
 
 # Internal
 from buteo.utils import (
-    utils_io,
     utils_base,
     utils_gdal,
-    utils_bbox,
-    utils_path,
 )
 from buteo.vector.metadata import _vector_to_metadata
 from buteo.vector.core_vector import _vector_open
@@ -16,6 +16,7 @@ from buteo.array.convolution import (
 from buteo.array.convolution_kernels import (
     kernel_base,
     kernel_get_offsets_and_weights,
+    _kernel_base_offsets_and_weights,
 )
 
 
@@ -43,6 +44,16 @@ def test_get_kernel_complex_1():
     assert np.isclose(kernel.sum(), weights.sum())
     assert np.isclose(kernel.sum(), 1.0)
 
+def test_get_kernel_cached():
+    """ Test _kernel_base_offsets_and_weights() """
+    offsets, weights = _kernel_base_offsets_and_weights(2)
+    offsets_ref, weights_ref = kernel_get_offsets_and_weights(kernel_base(2))
+
+    assert np.array_equal(offsets, offsets_ref)
+    assert np.array_equal(weights, weights_ref)
+    assert _kernel_base_offsets_and_weights(2)[0] is offsets
+    assert not offsets.flags.writeable and not weights.flags.writeable
+
 def test_pad_array():
     """ Basic tests for pad_array (view) """
     arr = np.random.rand(3, 3, 1)
@@ -82,3 +93,20 @@ def test_convolve_array_sum():
 
     assert np.all(result > arr), "Result should be greater than input"
     assert result.shape == (15, 15, 1)
+
+
+def test_convolve_array_median_nan():
+    """ Test convolve_array() with method=median on an array with NaN values """
+    np.random.seed(42)
+    arr = np.random.rand(50, 50, 1).astype("float32")
+    arr[np.random.rand(50, 50, 1) < 0.2] = np.nan
+
+    kernel = kernel_base(1, normalised=False, circular=False)
+    offsets, weights = kernel_get_offsets_and_weights(kernel, remove_zero_weights=True)
+
+    result = convolve_array(arr, offsets, weights, method=5) # median
+
+    assert result.shape == (50, 50, 1)
+
+    finite = np.all(np.isfinite(np.lib.stride_tricks.sliding_window_view(arr[:, :, 0], (3, 3))), axis=(2, 3))
+    assert np.allclose(result[1:-1, 1:-1, 0][finite], np.median(np.lib.stride_tricks.sliding_window_view(arr[:, :, 0], (3, 3)), axis=(2, 3))[finite])
@@ -117,6 +117,67 @@ def test_raster_to_metadata_single_raster():
 
     gdal.Unlink(raster_1)
 
+def test_raster_to_metadata_latlng():
+    """ Test: raster to metadata. Latlng fields are computed on access. """
+    raster_1 = create_sample_raster()
+    metadata = core_raster._get_basic_metadata_raster(raster_1)
+
+    assert "bbox_latlng" in metadata
+    assert metadata["projection_osr"].IsGeographic()
+    assert metadata["bbox_latlng"] == [0.0, 10.0, 0.0, 10.0]
+    assert metadata["area_latlng"] == 100.0
+    assert metadata.get("centroid_latlng") == (5.0, 5.0)
+    assert "area_latlng" in metadata.keys()
+
+    gdal.Unlink(raster_1)
+
+def test_raster_to_metadata_cached(tmp_path):
+    """ Test: raster to metadata. Cached for rasters on disk. """
+    raster_1 = create_sample_raster()
+    raster_2 = create_sample_raster(nodata=0.0)
+    path = str(tmp_path / "cached.tif")
+    gdal.GetDriverByName("GTiff").CreateCopy(path, gdal.Open(raster_1))
+
+    metadata = core_raster._get_basic_metadata_raster(path)
+    metadata["shape"][2] = 99
+    metadata_again = core_raster._get_basic_metadata_raster(path)
+
+    assert metadata_again["shape"][2] == 1
+    assert metadata_again["nodata"] is False
+
+    # Overwriting the file invalidates the cached entry.
+    gdal.GetDriverByName("GTiff").CreateCopy(path, gdal.Open(raster_2))
+    metadata_new = core_raster._get_basic_metadata_raster(path)
+
+    assert metadata_new["nodata"] is True
+
+    gdal.Unlink(raster_1)
+    gdal.Unlink(raster_2)
+
+def test_raster_to_metadata_disk_cache(tmp_path, monkeypatch):
+    """ Test: raster to metadata. Cached on disk across processes. """
+    raster_1 = create_sample_raster()
+    path = str(tmp_path / "cached_disk.tif")
+    cache_dir = tmp_path / "cache"
+    gdal.GetDriverByName("GTiff").CreateCopy(path, gdal.Open(raster_1))
+
+    monkeypatch.setenv("BUTEO_METADATA_CACHE_DIR", str(cache_dir))
+    core_raster._get_basic_metadata_raster_cached.cache_clear()
+    metadata = core_raster._get_basic_metadata_raster(path)
+
+    assert len(list(cache_dir.iterdir())) == 1
+
+    # A fresh in-process cache reads the pickled metadata back.
+    core_raster._get_basic_metadata_raster_cached.cache_clear()
+    metadata_disk = core_raster._get_basic_metadata_raster(path)
+
+    assert metadata_disk["shape"] == metadata["shape"]
+    assert metadata_disk["path"] == metadata["path"]
+    assert metadata_disk["projection_osr"].IsSame(metadata["projection_osr"])
+
+    core_raster._get_basic_metadata_raster_cached.cache_clear()
+    gdal.Unlink(raster_1)
+
 def test_rasters_are_aligned_same_projection():
     """ Test: rasters are aligned. Same projection. """
     raster_1 = create_sample_raster()
@@ -154,6 +215,15 @@ def test_rasters_are_aligned_different_extent():
     gdal.Unlink(raster_1)
     gdal.Unlink(raster_2)
 
+def test_rasters_are_aligned_different_height():
+    """ Test: rasters are aligned. Same width, different height. """
+    raster_1 = create_sample_raster(width=10, height=10, y_max=20)
+    raster_2 = create_sample_raster(width=10, height=20, y_max=20)
+    assert not core_raster.check_rasters_are_aligned([raster_1, raster_2])
+
+    gdal.Unlink(raster_1)
+    gdal.Unlink(raster_2)
+
 def test_rasters_are_aligned_same_dtype():
     """ Test: rasters are aligned. Same dtype. """
     raster_1 = create_sample_raster()
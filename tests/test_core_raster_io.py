@@ -322,6 +322,16 @@ def test_overlap(sample_raster):
         assert offsets in expected_offsets
         assert chunk.shape == (55, 55, 3)
 
+def test_prefetch(sample_raster):
+    chunks = list(core_raster_io.raster_to_array_chunks(sample_raster, chunks=4))
+    chunks_prefetched = list(core_raster_io.raster_to_array_chunks(sample_raster, chunks=4, prefetch=True))
+
+    assert len(chunks) == len(chunks_prefetched) == 4
+
+    for (chunk, offsets), (chunk_prefetched, offsets_prefetched) in zip(chunks, chunks_prefetched):
+        assert offsets == offsets_prefetched
+        assert np.array_equal(chunk, chunk_prefetched)
+
 def test_filled_and_fill_value(sample_raster):
     chunk_gen = core_raster_io.raster_to_array_chunks(
         sample_raster,
@@ -393,6 +403,58 @@ def test_create_raster_from_array_special():
     assert gt[1] == 0.5 # width_res
     assert gt[5] == -0.5 # height_res
 
+    for band_idx in range(3):
+        assert np.array_equal(ds.GetRasterBand(band_idx + 1).ReadAsArray(), arr[:, :, band_idx])
+
+    ds = None
+    gdal.Unlink(output_name)
+
+def test_create_raster_from_array_channel_first():
+    """ Test: Create raster from a channel first array. """
+    arr = np.random.rand(3, 10, 12).astype(np.float32) # (bands, height, width)
+    output_name = core_raster_io.raster_create_from_array(arr, channel_last=False)
+
+    ds = gdal.Open(output_name)
+    assert ds.RasterXSize == 12
+    assert ds.RasterYSize == 10
+    assert ds.RasterCount == 3
+
+    for band_idx in range(3):
+        assert np.array_equal(ds.GetRasterBand(band_idx + 1).ReadAsArray(), arr[band_idx])
+
+    ds = None
+    gdal.Unlink(output_name)
+
+def test_create_raster_from_array_predictor():
+    """ Test: Create raster from array adds a predictor matching the datatype. """
+    arr = np.random.rand(10, 10).astype(np.float32)
+    output_name = core_raster_io.raster_create_from_array(arr)
+
+    ds = gdal.Open(output_name)
+    assert ds.GetMetadataItem("PREDICTOR", "IMAGE_STRUCTURE") == "3"
+    assert np.array_equal(ds.GetRasterBand(1).ReadAsArray(), arr)
+    ds = None
+    gdal.Unlink(output_name)
+
+    arr = np.random.randint(0, 100, (10, 10)).astype(np.int16)
+    output_name = core_raster_io.raster_create_from_array(arr, creation_options=["PREDICTOR=1"])
+
+    ds = gdal.Open(output_name)
+    assert ds.GetMetadataItem("PREDICTOR", "IMAGE_STRUCTURE") in [None, "1"]
+    ds = None
+    gdal.Unlink(output_name)
+
+def test_create_raster_from_array_nodata():
+    """ Test: Create raster from a plain array with a nodata value. """
+    arr = np.random.rand(10, 10).astype(np.float32)
+    arr[0, 0] = -9999.0
+    output_name = core_raster_io.raster_create_from_array(arr, nodata_value=-9999.0)
+
+    ds = gdal.Open(output_name)
+    assert ds.GetRasterBand(1).GetNoDataValue() == -9999.0
+    assert ds.GetRasterBand(1).ReadAsArray()[0, 0] == -9999.0
+    ds = None
+
     gdal.Unlink(output_name)
 
 def test_create_raster_from_array_invalid_input():
@@ -72,6 +72,67 @@ def test_raster_stack_list_multi_band_uneven():
     # Clean up
     delete_dataset_if_in_memory(stacked_raster_path)
 
+def test_raster_stack_list_values():
+    # Create sample rasters, larger than a single block
+    raster1 = create_sample_raster(width=600, height=300, bands=2)
+    raster2 = create_sample_raster(width=600, height=300, bands=1)
+
+    # Check that every band is copied over unchanged and in order
+    expected = np.concatenate([
+        core_raster_io.raster_to_array(raster1),
+        core_raster_io.raster_to_array(raster2),
+    ], axis=2)
+
+    for method in ["translate", "blocks"]:
+        stacked_raster_path = core_stack.raster_stack_list([raster1, raster2], method=method)
+
+        assert np.array_equal(core_raster_io.raster_to_array(stacked_raster_path), expected)
+
+        # Clean up
+        delete_dataset_if_in_memory(stacked_raster_path)
+
+def test_raster_stack_list_values_threaded():
+    # Create sample rasters, large enough to be read in threads
+    raster1 = create_sample_raster(width=1200, height=900, bands=2)
+    raster2 = create_sample_raster(width=1200, height=900, bands=1)
+    raster3 = create_sample_raster(width=1200, height=900, bands=1)
+
+    # Stack rasters
+    stacked_raster_path = core_stack.raster_stack_list([raster1, raster2, raster3], method="blocks")
+
+    # Check that every band is copied over unchanged and in order
+    expected = np.concatenate([
+        core_raster_io.raster_to_array(raster1),
+        core_raster_io.raster_to_array(raster2),
+        core_raster_io.raster_to_array(raster3),
+    ], axis=2)
+
+    assert np.array_equal(core_raster_io.raster_to_array(stacked_raster_path), expected)
+
+    # Clean up
+    delete_dataset_if_in_memory(stacked_raster_path)
+
+def test_raster_stack_list_parallel():
+    # Create sample rasters
+    raster1 = create_sample_raster(width=10, height=10, bands=2)
+    raster2 = create_sample_raster(width=10, height=10, bands=1)
+
+    # Stack rasters, one file per band behind a VRT
+    stacked_raster_path = core_stack.raster_stack_list([raster1, raster2], parallel=True)
+
+    # Check output raster properties
+    assert stacked_raster_path.endswith(".vrt")
+    stacked_raster = gdal.Open(stacked_raster_path)
+    assert stacked_raster.RasterCount == 3
+    assert np.array_equal(
+        core_raster_io.raster_to_array(stacked_raster_path),
+        core_raster_io.raster_to_array([raster1, raster2]),
+    )
+
+    # Clean up
+    stacked_raster = None
+    delete_dataset_if_in_memory(stacked_raster_path)
+
 def test_raster_stack_list_dtype():
     # Create sample rasters
     raster1 = create_sample_raster(width=10, height=10, bands=1, datatype=gdal.GDT_Int16)
@@ -88,6 +149,26 @@ def test_raster_stack_list_dtype():
     # Clean up
     delete_dataset_if_in_memory(stacked_raster_path)
 
+def test_raster_stack_list_compression():
+    # Create sample rasters
+    raster1 = create_sample_raster(width=10, height=10, bands=1)
+    raster2 = create_sample_raster(width=10, height=10, bands=1)
+
+    # Stack rasters
+    stacked_raster_path = core_stack.raster_stack_list([raster1, raster2], compression="zstd")
+
+    # Check output raster properties
+    stacked_raster = gdal.Open(stacked_raster_path)
+    assert stacked_raster.GetMetadata("IMAGE_STRUCTURE")["COMPRESSION"] == "ZSTD"
+    assert np.array_equal(
+        core_raster_io.raster_to_array(stacked_raster_path),
+        core_raster_io.raster_to_array([raster1, raster2]),
+    )
+
+    # Clean up
+    stacked_raster = None
+    delete_dataset_if_in_memory(stacked_raster_path)
+
 def test_raster_stack_list_raises_error_on_unaligned_rasters():
     # Create unaligned sample rasters
     raster1 = create_sample_raster(width=10, height=10, bands=1)
@@ -55,6 +55,25 @@ def test_raster_set_datatype_float32():
     except:
         pass
 
+def test_raster_set_datatype_unchanged():
+    raster_path = create_sample_raster(datatype=gdal.GDT_Byte)
+
+    output_path = os.path.join(tmpdir, 'converted_unchanged.tif')
+    converted_raster = raster_set_datatype(raster_path, 'uint8', out_path=output_path)
+
+    converted_ds = gdal.Open(converted_raster)
+    source_ds = gdal.Open(raster_path)
+
+    assert converted_ds.GetRasterBand(1).DataType == gdal.GDT_Byte
+    assert (converted_ds.ReadAsArray() == source_ds.ReadAsArray()).all()
+
+    converted_ds = None
+    source_ds = None
+    try:
+        os.remove(output_path)
+    except:
+        pass
+
 # def test_raster_set_datatype_uint8():
 #     raster_path = create_sample_raster(datatype=gdal.GDT_Float32)
 #     dtype = 'byte'
@@ -17,6 +17,7 @@ from buteo.array.patches import (
     _merge_weighted_mad,
     _merge_weighted_mode,
     _borders_are_necessary,
+    _array_to_patches_view,
     _array_to_patches_single,
     _patches_to_array_single,
     array_to_patches,
@@ -264,6 +265,23 @@ def test_array_to_patches_single_no_divisible_dimensions():
     assert patches.shape == (4, 32, 32, 3)
 
 
+def test_array_to_patches_view():
+    """ Test that the patch view matches the array without copying it. """
+    arr = np.random.rand(70, 90, 2)
+    tile_size = 16
+    offset = [5, 7]
+    view = _array_to_patches_view(arr, tile_size, offset)
+
+    assert view.shape == (4, 5, 16, 16, 2)
+    assert np.shares_memory(view, arr)
+    assert np.array_equal(view[1, 2], arr[21:37, 39:55])
+
+    patches = _array_to_patches_single(arr, tile_size, offset)
+
+    assert patches.flags.c_contiguous
+    assert not np.shares_memory(patches, arr)
+    assert np.array_equal(patches[1 * 5 + 2], arr[21:37, 39:55])
+
 def test_patches_to_array_single_basic():
     """ Test that the patches are correctly converted to an array. (basic) """
     arr = np.random.rand(64, 64, 3)
@@ -312,6 +330,20 @@ def test_patches_to_array_single_different_offset_height_and_width():
 
     assert np.allclose(arr[20:52, 10:74], restored_arr[20:52, 10:74])
 
+def test_patches_to_array_single_out():
+    """ Test that the patches are written into a preallocated array. """
+    arr = np.random.rand(80, 100, 3)
+    tile_size = 32
+    offset = [20, 10]
+    patches = _array_to_patches_single(arr, tile_size, offset)
+    out = np.zeros((2, 80, 100, 3), dtype=patches.dtype)
+    restored_arr = _patches_to_array_single(patches, arr.shape, tile_size, offset, 0.0, out=out[1])
+
+    assert np.shares_memory(restored_arr, out)
+    assert np.allclose(arr[20:52, 10:74], out[1, 20:52, 10:74])
+    assert np.all(out[1, :20] == 0.0)
+    assert np.all(out[0] == 0.0)
+
 def test_array_to_patches_basic():
     """ Test that the array is correctly divided into patches (basic). """
     arr = np.random.rand(64, 64, 3)
@@ -331,6 +363,30 @@ def test_array_to_patches_multiple_offsets():
     assert patches.shape == (21, tile_size, tile_size, arr.shape[2])
 
 
+def test_array_to_patches_out_path(tmp_path):
+    """ Test that the patches are written straight to a .npy file. """
+    arr = np.random.rand(96, 96, 3).astype(np.float32)
+    tile_size = 32
+    out_path = str(tmp_path / "patches.npy")
+    patches = array_to_patches(arr, tile_size, n_offsets=1, out_path=out_path)
+
+    assert np.array_equal(np.load(out_path), array_to_patches(arr, tile_size, n_offsets=1))
+    assert np.array_equal(np.load(out_path), patches)
+
+    patches = array_to_patches(arr.transpose(2, 0, 1), tile_size, n_offsets=1, channel_last=False, out_path=out_path)
+
+    assert np.load(out_path).shape == (13, 3, tile_size, tile_size)
+    assert np.array_equal(np.load(out_path), array_to_patches(arr, tile_size, n_offsets=1).transpose(0, 3, 1, 2))
+
+def test_array_to_patches_dtype():
+    """ Test that the patches are cast while they are cut. """
+    arr = np.random.rand(96, 96, 3).astype(np.float32) * 255.0
+    tile_size = 32
+    patches = array_to_patches(arr, tile_size, n_offsets=1, dtype="uint8")
+
+    assert patches.dtype == np.uint8
+    assert np.array_equal(patches, array_to_patches(arr, tile_size, n_offsets=1).astype(np.uint8))
+
 # Dummy callback function for testing purposes
 def dummy_callback(arr: np.ndarray) -> np.ndarray:
     return arr * 2
@@ -432,6 +488,18 @@ def test_predict_array_merge_method_mode():
 
     assert predicted_array.shape == arr.shape
 
+def test_predict_array_uneven_batches():
+    """ Test the predict_array function with a batch size that does not divide the patches. """
+    arr = np.random.rand(70, 70, 1).astype(np.float32)
+    tile_size = 32
+
+    predicted_array = predict_array(
+        arr, lambda x: x, tile_size=tile_size, n_offsets=1, batch_size=3, edge_weighted=False, merge_method="mean",
+    )
+
+    assert predicted_array.shape == arr.shape
+    assert np.allclose(predicted_array, arr)
+
 def dummy_callback_pixel(arr: np.ndarray) -> np.ndarray:
     """ A simple dummy callback function that returns the input array squared. """
     return arr * 3
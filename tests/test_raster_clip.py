@@ -154,3 +154,25 @@ def test_raster_clip_complete_intersection():
         os.remove(output_path)
     except:
         pass
+
+
+def test_raster_clip_multiple_rasters_mixed_projections():
+    # The clip geometry must be reprojected for both raster projections, and each projection must keep its own copy.
+    raster_path_a = create_sample_raster(width=100, height=300, pixel_width=10000, pixel_height=10000, x_min=0, y_max=7000000, epsg_code=25832)
+    raster_path_b = create_sample_raster(width=150, height=300, pixel_width=10000, pixel_height=10000, x_min=-500000, y_max=7000000, epsg_code=25833)
+
+    polygon_wkt = 'POLYGON ((667917 6446276, 667917 7170156, 1113195 7170156, 1113195 6446276, 667917 6446276))'
+    clip_geom = ogr.CreateGeometryFromWkt(polygon_wkt, parse_projection(3857))
+
+    result_paths = raster_clip(raster=[raster_path_a, raster_path_b, raster_path_a], clip_geom=clip_geom)
+    result_single = raster_clip(raster=raster_path_a, clip_geom=clip_geom)
+
+    result_ds = gdal.Open(result_paths[2])
+    single_ds = gdal.Open(result_single)
+
+    assert result_ds.GetGeoTransform() == single_ds.GetGeoTransform()
+    assert result_ds.RasterXSize == single_ds.RasterXSize
+    assert result_ds.RasterYSize == single_ds.RasterYSize
+
+    result_ds = None
+    single_ds = None
@@ -0,0 +1,50 @@
+""" Tests for eo/s1_utils.py """
+
+
+# Standard library
+import sys; sys.path.append("../")
+
+# External
+import numpy as np
+
+# Internal
+from buteo.eo.s1_utils import (
+    s1_db_to_int16,
+    s1_int16_to_db,
+)
+
+
+def test_s1_db_to_int16_rounding():
+    """ Test that dB values are rounded to 0.01 dB. """
+    arr = np.array([-12.344, -12.346, 0.0, 3.004, 7.5], dtype=np.float32)
+    result = s1_db_to_int16(arr)
+
+    assert result.dtype == np.int16
+    assert np.array_equal(result, [-1234, -1235, 0, 300, 750])
+
+    restored = s1_int16_to_db(result)
+    assert restored.dtype == np.float32
+    assert np.allclose(restored, arr, atol=0.005 + 1e-6)
+
+def test_s1_db_to_int16_clipping():
+    """ Test that values outside the int16 range are clipped to +-327.67 dB. """
+    arr = np.array([-500.0, -327.67, 327.67, 500.0], dtype=np.float32)
+    result = s1_db_to_int16(arr)
+
+    assert np.array_equal(result, [-32767, -32767, 32767, 32767])
+    assert np.allclose(s1_int16_to_db(result), [-327.67, -327.67, 327.67, 327.67])
+
+def test_s1_db_to_int16_nodata():
+    """ Test that NaN, inf and the nodata value map to -32768, and are restored as nodata. """
+    arr = np.array([np.nan, np.inf, -np.inf, -9999.0, -15.25], dtype=np.float32)
+    result = s1_db_to_int16(arr, nodata_value=-9999.0)
+
+    assert np.array_equal(result, [-32768, -32768, -32768, -32768, -1525])
+
+    restored = s1_int16_to_db(result)
+    assert np.all(np.isnan(restored[:4]))
+    assert np.isclose(restored[4], -15.25)
+
+    restored = s1_int16_to_db(result, nodata_value=-9999.0)
+    assert np.array_equal(restored[:4], [-9999.0] * 4)
+    assert np.isclose(restored[4], -15.25)
@@ -97,3 +97,30 @@ def test_scaler_truncate_another_input():
     result, _stat_dict = scaler_truncate(arr * 2, trunc_min=4.0, trunc_max=8.0, target_min=0.0, target_max=1.0)
     expected = np.array([0.0, 0.0, 0.5, 1.0, 1.0], dtype=float)
     assert np.allclose(result, expected)
+
+def test_scaler_to_range_integer_input():
+    """ Test the to-range scaler with an integer input and with a constant input. """
+    result, _stat_dict = scaler_to_range(np.array([0, 1000, 2000], dtype=np.uint16), min_val=0, max_val=255)
+    assert result.dtype == np.float32
+    assert np.allclose(result, [0.0, 127.5, 255.0])
+
+    result, _stat_dict = scaler_to_range(np.array([3, 3], dtype=np.uint16), min_val=1.0, max_val=2.0)
+    assert np.allclose(result, [1.0, 1.0])
+
+def test_scaler_to_range_large_offset():
+    """ Test the to-range scaler with values far from zero, which float32 cannot tell apart. """
+    result, _stat_dict = scaler_to_range(1e8 + np.arange(5.0))
+    assert np.allclose(result, [0.0, 0.25, 0.5, 0.75, 1.0])
+
+    result, _stat_dict = scaler_to_range((2**30 + np.arange(5)).astype(np.int64))
+    assert np.allclose(result, [0.0, 0.25, 0.5, 0.75, 1.0])
+
+def test_scaler_truncate_integer_input():
+    """ Test the truncate scaler with an integer input. """
+    result, stat_dict = scaler_truncate(
+        np.array([0, 500, 1000, 3000], dtype=np.uint16), trunc_min=500, trunc_max=2000, target_min=0, target_max=255,
+    )
+    assert result.dtype == np.float32
+    assert np.allclose(result, [0.0, 0.0, 85.0, 255.0])
+    assert stat_dict["arr_min"] == 500
+    assert stat_dict["arr_max"] == 2000